@@ -13,6 +13,10 @@ from datetime import datetime
 import getpass
 
 
+# Réponses acceptées comme « oui » dans les questions en mode console
+YES_ANSWERS = frozenset({'o', 'oui', 'y', 'yes'})
+
+
 class ConfigManager:
     """Gestionnaire de configuration sécurisé"""
     
@@ -344,7 +348,7 @@ def setup_api_key_interactive() -> Optional[str]:
     if current_key:
         print("✅ Une clé API est déjà configurée")
         choice = input("Voulez-vous la remplacer ? (o/N): ").lower().strip()
-        if choice not in ['o', 'oui', 'y', 'yes']:
+        if choice not in YES_ANSWERS:
             return current_key
     
     print("\n📝 Entrez votre clé API OpenAI:")
@@ -360,7 +364,7 @@ def setup_api_key_interactive() -> Optional[str]:
     if not api_key.startswith("sk-"):
         print("⚠️ La clé API devrait commencer par 'sk-'")
         choice = input("Continuer quand même ? (o/N): ").lower().strip()
-        if choice not in ['o', 'oui', 'y', 'yes']:
+        if choice not in YES_ANSWERS:
             return None
     
     # Sauvegarder
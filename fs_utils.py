@@ -0,0 +1,35 @@
+# fs_utils.py
+"""
+Utilitaires partagés par le scanner et l'injecteur:
+parcours de l'arborescence du jeu et valeur sentinelle commune.
+"""
+
+import os
+
+# Valeur sentinelle pour distinguer un attribut ou une clé absente d'une valeur None
+MISSING = object()
+
+
+def iter_files(root):
+    """
+    Parcourt récursivement root avec os.scandir et produit les DirEntry des fichiers.
+    Le type des entrées vient de readdir: pas de stat() supplémentaire par fichier.
+    Un dossier illisible est ignoré (comme os.walk) au lieu d'interrompre le parcours.
+    """
+    stack = [root]
+    while stack:
+        subdirs = []
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append(entry.path)
+                        elif entry.is_file():
+                            yield entry
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+        # Même ordre de parcours qu'os.walk (profondeur d'abord, ordre du listing)
+        stack.extend(reversed(subdirs))
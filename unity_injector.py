@@ -5,64 +5,363 @@ Version corrigée avec gestion d'erreurs robuste et vérifications d'intégrité
 """
 
 import os
+import re
+import sys
+import errno
+import random
 import shutil
-import hashlib
+import io
+import mmap
+import tarfile
+import threading
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Dict, Optional, Callable
+from typing import List, Dict, Optional, Callable, Tuple
 import UnityPy
+from UnityPy.enums import ClassIDType
 from datetime import datetime
+from fs_utils import iter_files, MISSING
+
+# CRC32C accéléré matériellement (optionnel) pour vérifier les copies, sinon zlib.crc32
+try:
+    import google_crc32c
+    CRC32C_AVAILABLE = True
+except ImportError:
+    google_crc32c = None
+    CRC32C_AVAILABLE = False
+
+# Taille du tampon de lecture pour le calcul des hash
+HASH_BUFFER_SIZE = 1024 * 1024
+
+# Taille à partir de laquelle la somme de contrôle est calculée via mmap plutôt que par blocs
+MMAP_MIN_SIZE = 64 * 1024
+
+# Extensions traitées comme fichiers Unity (les autres sont des fichiers texte).
+# Comparées à suffix.lower(): toutes en minuscules ('.resS' s'écrit donc '.ress')
+UNITY_EXTENSIONS = frozenset(('.assets', '.bundle', '.resource', '.ress', '.dat'))
+
+# Types d'objets Unity dans lesquels des traductions peuvent être injectées
+INJECTABLE_TYPES = frozenset((ClassIDType.TextAsset, ClassIDType.MonoBehaviour))
+
+# Niveaux de vérification des sauvegardes, du plus rapide au plus strict:
+# 'size' (taille seule), 'hash' (taille + somme de contrôle), 'unity_load' (+ rechargement UnityPy)
+VERIFY_LEVELS = ('size', 'hash', 'unity_load')
+
+# Nombre de messages en attente au-delà duquel le tampon de sortie est vidé
+LOG_FLUSH_THRESHOLD = 256
+
+# Remplacement de fichier: tentatives et attente maximale (s) si le fichier est verrouillé
+REPLACE_ATTEMPTS = 10
+REPLACE_MAX_WAIT = 0.5
+
+
+# Étapes d'un chemin de champ MonoBehaviour: 'nom' ou 'nom[index]'
+_PATH_STEP_RE = re.compile(r'([^.\[\]]+)(?:\[(\d+)\])?')
+
+# Types de valeurs conservés lors de la lecture directe des attributs d'un MonoBehaviour
+_PRIMITIVES = (str, int, float, bool, list, dict)
+
+
+# Tampons de lecture réutilisés d'un appel à l'autre (un par thread)
+_hash_buffers = threading.local()
+
+
+def _get_hash_buffer() -> bytearray:
+    """Retourne le tampon de lecture du thread courant, alloué une seule fois"""
+    buffer = getattr(_hash_buffers, 'buffer', None)
+    if buffer is None:
+        buffer = _hash_buffers.buffer = bytearray(HASH_BUFFER_SIZE)
+    return buffer
+
+
+def _fast_copy(src: Path, dst: Path) -> None:
+    """
+    Copie src vers dst comme shutil.copy2, mais sans passer par l'espace utilisateur
+    quand c'est possible (copy_file_range: copie noyau, voire clonage sur Btrfs/XFS).
+    """
+    if hasattr(os, 'copy_file_range'):
+        try:
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            if remaining == 0:
+                shutil.copystat(src, dst)
+                return
+        except OSError as e:
+            # Systèmes de fichiers différents ou appel non supporté: copie classique
+            if e.errno not in (errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP):
+                raise
+    
+    # shutil.copyfile utilise déjà sendfile (Linux) / fcopyfile (macOS)
+    shutil.copyfile(src, dst)
+    shutil.copystat(src, dst)
+
+
+def _replace_file(src: Path, dst: Path) -> None:
+    """
+    Remplace dst par src avec os.replace (renommage atomique, même répertoire).
+    Sous Windows, un antivirus ou le jeu peut verrouiller brièvement le fichier:
+    on réessaie alors avec une attente exponentielle et aléatoire.
+    """
+    for attempt in range(REPLACE_ATTEMPTS):
+        try:
+            os.replace(src, dst)
+            return
+        except PermissionError:
+            if attempt == REPLACE_ATTEMPTS - 1:
+                raise
+            time.sleep(min(REPLACE_MAX_WAIT, 0.01 * 2 ** attempt * random.uniform(0.5, 1.5)))
+
+
+def _update_checksum(crc: int, chunk) -> int:
+    """Étend la somme de contrôle CRC32C (ou CRC32 à défaut) avec un bloc de données"""
+    if CRC32C_AVAILABLE:
+        return google_crc32c.extend(crc, chunk)
+    return zlib.crc32(chunk, crc)
 
 
 class UnityTextInjector:
     """Injecteur de textes traduits avec sauvegarde et vérification d'intégrité"""
     
-    def __init__(self, game_path: str):
+    # Conversion du texte traduit vers le type du champ d'origine
+    _CONVERTERS = {
+        str: lambda v: v.decode('utf-8', errors='ignore') if isinstance(v, (bytes, bytearray)) else str(v),
+        bytes: lambda v: v.encode('utf-8') if isinstance(v, str) else bytes(v),
+        bytearray: lambda v: bytearray(v.encode('utf-8') if isinstance(v, str) else v),
+    }
+    
+    def __init__(
+        self, 
+        game_path: str, 
+        archive_backups: bool = False, 
+        verbose: bool = True,
+        verify_level: str = 'size',
+        max_workers: int = 1,
+        backup_dir: Optional[Path] = None,
+        link_backups: bool = False
+    ):
         self.game_path = Path(game_path)
-        self.backup_dir = Path("backups") / datetime.now().strftime("%Y%m%d_%H%M%S")
-        self.backup_dir.mkdir(parents=True, exist_ok=True)
+        
+        # max_workers > 1: fichiers injectés en parallèle dans un pool de processus
+        self.max_workers = max_workers
+        
+        if verify_level not in VERIFY_LEVELS:
+            raise ValueError(f"Niveau de vérification inconnu: {verify_level}")
+        self.verify_level = verify_level
+        
+        # Les messages sont accumulés puis écrits en bloc; en mode non verbeux
+        # seuls les erreurs et le résumé sont conservés
+        self.verbose = verbose
+        self._log_buffer: List[str] = []
+        # Vidage automatique du tampon quand il dépasse LOG_FLUSH_THRESHOLD messages
+        self._auto_flush = True
+        
+        # backup_dir explicite: permet aux processus du pool de partager le même dossier
+        self.backup_dir = Path(backup_dir) if backup_dir else Path("backups") / datetime.now().strftime("%Y%m%d_%H%M%S")
+        
+        # En mode archive, toutes les sauvegardes vont dans un unique .tar non compressé
+        self.archive_backups = archive_backups
+        # Sauvegardes par lien physique: aucun octet copié. Sûr car les fichiers
+        # modifiés sont toujours remplacés (os.replace), jamais réécrits sur place
+        self.link_backups = link_backups
+        self.backup_archive = self.backup_dir.with_suffix('.tar')
+        self.backup_tar = None
+        # Membres déjà présents dans l'archive (y compris ceux des injections précédentes)
+        self._archived_names: set = set()
+        if archive_backups:
+            self.backup_dir.parent.mkdir(parents=True, exist_ok=True)
+        else:
+            self.backup_dir.mkdir(parents=True, exist_ok=True)
+        
         self.success_count = 0
         self.error_count = 0
         self.processed_files = set()
+        self.written_files: List[Path] = []
+        # Résultats des vérifications complètes par (chemin, mtime_ns, taille)
+        self._loadable_cache: Dict[tuple, bool] = {}
+        # Chemins de champs déjà découpés en étapes
+        self._path_cache: Dict[str, Tuple[Tuple[str, Optional[int]], ...]] = {}
+        # Attributs publics définis par la classe (dir() n'est appelé qu'une fois par classe)
+        self._mono_attr_cache: Dict[type, Tuple[str, ...]] = {}
 
-    def create_backup(self, file_path: Path) -> bool:
-        """Crée une sauvegarde du fichier avec vérification d'intégrité"""
+    def _log(self, message: str, always: bool = False) -> None:
+        """Ajoute un message au tampon de sortie"""
+        if self.verbose or always:
+            self._log_buffer.append(message)
+            if self._auto_flush and len(self._log_buffer) >= LOG_FLUSH_THRESHOLD:
+                self._flush_log()
+
+    def _flush_log(self) -> None:
+        """Écrit en une seule fois les messages en attente sur la sortie standard"""
+        if self._log_buffer:
+            sys.stdout.write('\n'.join(self._log_buffer) + '\n')
+            self._log_buffer.clear()
+
+    def create_backup(self, file_path: Path, verify_level: Optional[str] = None) -> bool:
+        """
+        Crée une sauvegarde du fichier avec vérification d'intégrité.
+        verify_level remplace ponctuellement le niveau choisi à la construction.
+        """
+        verify_level = verify_level or self.verify_level
         try:
             if not file_path.exists():
-                print(f"❌ Fichier source inexistant: {file_path}")
+                self._log(f"❌ Fichier source inexistant: {file_path}", always=True)
                 return False
                 
             relative_path = file_path.relative_to(self.game_path)
+            if self.archive_backups:
+                return self._add_to_backup_archive(file_path, relative_path, verify_level)
+            
             backup_path = self.backup_dir / relative_path
             backup_path.parent.mkdir(parents=True, exist_ok=True)
             
-            # Copier avec préservation des métadonnées
-            shutil.copy2(file_path, backup_path)
+            if self.link_backups:
+                try:
+                    os.link(file_path, backup_path)
+                    self._log(f"✅ Sauvegarde créée (lien): {relative_path}")
+                    return True
+                except OSError:
+                    pass  # Autre volume ou système de fichiers sans liens: copie
+            
+            # La copie a réussi: par défaut on se contente de comparer les tailles,
+            # la relecture complète des fichiers n'a lieu qu'à la demande
+            if verify_level == 'size':
+                # Copier avec préservation des métadonnées
+                _fast_copy(file_path, backup_path)
+                verified = file_path.stat().st_size == backup_path.stat().st_size
+            else:
+                # La somme de contrôle de l'original est calculée pendant la copie,
+                # la source n'est donc lue qu'une seule fois
+                original_checksum = self._copy_with_checksum(file_path, backup_path)
+                verified = self._verify_backup_integrity(file_path, backup_path, original_checksum)
+                if (verified and verify_level == 'unity_load'
+                        and file_path.suffix.lower() in UNITY_EXTENSIONS):
+                    verified = self._verify_unity_file_integrity(backup_path)
             
-            # Vérification d'intégrité par taille et hash
-            if not self._verify_backup_integrity(file_path, backup_path):
-                print(f"❌ Échec de la vérification de sauvegarde: {file_path}")
+            if not verified:
+                self._log(f"❌ Échec de la vérification de sauvegarde: {file_path}", always=True)
                 return False
                 
-            print(f"✅ Sauvegarde créée: {relative_path}")
+            self._log(f"✅ Sauvegarde créée: {relative_path}")
             return True
             
         except PermissionError:
-            print(f"❌ Permission refusée pour sauvegarder: {file_path}")
+            self._log(f"❌ Permission refusée pour sauvegarder: {file_path}", always=True)
             return False
         except Exception as e:
-            print(f"❌ Erreur lors de la sauvegarde de {file_path}: {e}")
+            self._log(f"❌ Erreur lors de la sauvegarde de {file_path}: {e}", always=True)
             return False
 
-    def _verify_backup_integrity(self, original: Path, backup: Path) -> bool:
-        """Vérifie l'intégrité de la sauvegarde"""
+    def _add_to_backup_archive(
+        self, 
+        file_path: Path, 
+        relative_path: Path, 
+        verify_level: str = 'size'
+    ) -> bool:
+        """Ajoute le fichier à l'archive de sauvegarde (ouverte une seule fois, complétée ensuite)"""
+        if self.backup_tar is None:
+            # Une archive existante (injection précédente) est complétée, jamais tronquée
+            mode = 'a' if self.backup_archive.exists() else 'w'
+            self.backup_tar = tarfile.open(self.backup_archive, mode=mode)
+            self._archived_names = set(self.backup_tar.getnames())
+        
+        arcname = relative_path.as_posix()
+        if arcname in self._archived_names:
+            # La première copie archivée est l'original: ne pas la masquer par une version modifiée
+            self._log(f"✅ Sauvegarde déjà archivée: {relative_path}")
+            return True
+        
+        # tarfile échoue si le fichier change de taille pendant la copie
+        self.backup_tar.add(file_path, arcname=arcname)
+        
+        # La sauvegarde doit être sur disque avant que l'original ne soit remplacé
+        archive_file = self.backup_tar.fileobj
+        archive_file.flush()
+        os.fsync(archive_file.fileno())
+        
+        # En écriture, tarfile ne renseigne pas offset_data: les données du membre
+        # précèdent directement la position courante (complétées au bloc de 512 octets)
+        member = self.backup_tar.members[-1]
+        data_offset = self.backup_tar.offset - (member.size + (-member.size % tarfile.BLOCKSIZE))
+        if verify_level != 'size' and not self._verify_archive_member(
+                file_path, member.size, data_offset, verify_level):
+            self._log(f"❌ Échec de la vérification de sauvegarde: {file_path}", always=True)
+            return False
+        
+        self._archived_names.add(arcname)
+        self._log(f"✅ Sauvegarde archivée: {relative_path}")
+        return True
+
+    def _verify_archive_member(self, file_path: Path, size: int, offset: int, verify_level: str) -> bool:
+        """Relit depuis le disque le membre tout juste archivé (size octets à offset) et le compare à l'original"""
+        if size != file_path.stat().st_size:
+            return False
+        
+        # Somme de contrôle du contenu du membre, lu directement à sa position dans le .tar
+        buffer = _get_hash_buffer()
+        view = memoryview(buffer)
+        crc = 0
+        remaining = size
+        with open(self.backup_archive, "rb", buffering=0) as f:
+            f.seek(offset)
+            while remaining:
+                read = f.readinto(view[:min(remaining, len(buffer))])
+                if not read:
+                    return False
+                crc = _update_checksum(crc, view[:read])
+                remaining -= read
+        
+        original_checksum = self._calculate_checksum(file_path)
+        if not original_checksum or f"{crc:08x}" != original_checksum:
+            return False
+        
+        if verify_level == 'unity_load' and file_path.suffix.lower() in UNITY_EXTENSIONS:
+            with open(self.backup_archive, "rb") as f:
+                f.seek(offset)
+                return self._verify_unity_file_integrity(f.read(size))
+        return True
+
+    def close_backup_archive(self) -> None:
+        """Ferme l'archive de sauvegarde si elle est ouverte"""
+        if self.backup_tar is not None:
+            self.backup_tar.close()
+            self.backup_tar = None
+
+    def _verify_backup_integrity(
+        self, 
+        original: Path, 
+        backup: Path, 
+        original_checksum: Optional[str] = None
+    ) -> bool:
+        """
+        Vérifie l'intégrité de la sauvegarde.
+        Si la somme de contrôle de l'original est déjà connue, seule la sauvegarde est relue.
+        """
         try:
             # Vérification de la taille
-            if original.stat().st_size != backup.stat().st_size:
+            original_size = original.stat().st_size
+            if original_size != backup.stat().st_size:
                 return False
                 
-            # Vérification par hash MD5 pour les petits fichiers (< 50 MB)
-            if original.stat().st_size < 50 * 1024 * 1024:
-                return self._calculate_hash(original) == self._calculate_hash(backup)
+            # Vérification par hash pour les petits fichiers (< 50 MB),
+            # les deux fichiers étant lus et hashés en parallèle
+            if original_size < 50 * 1024 * 1024:
+                # Une somme vide signale une lecture impossible: la sauvegarde n'est pas vérifiée
+                if original_checksum is not None:
+                    backup_checksum = self._calculate_checksum(backup)
+                    return bool(backup_checksum) and backup_checksum == original_checksum
+                
+                with ThreadPoolExecutor(max_workers=2) as executor:
+                    original_crc = executor.submit(self._calculate_checksum, original)
+                    backup_crc = executor.submit(self._calculate_checksum, backup)
+                    backup_checksum = backup_crc.result()
+                    return bool(backup_checksum) and original_crc.result() == backup_checksum
             
             # Pour les gros fichiers, on se contente de la taille
             return True
@@ -70,17 +369,51 @@ class UnityTextInjector:
         except Exception:
             return False
 
-    def _calculate_hash(self, file_path: Path) -> str:
-        """Calcule le hash MD5 d'un fichier"""
-        hash_md5 = hashlib.md5()
+    def _calculate_checksum(self, file_path: Path) -> str:
+        """
+        Calcule une somme de contrôle CRC32C (ou CRC32) d'un fichier.
+        Suffisant pour détecter une copie corrompue, bien plus rapide qu'un hash.
+        """
+        # Fichiers moyens et gros: le CRC lit directement les pages projetées
+        # (lecture anticipée gérée par le noyau, aucune copie en espace utilisateur)
+        try:
+            if os.path.getsize(file_path) >= MMAP_MIN_SIZE:
+                with open(file_path, "rb") as f, \
+                        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    return f"{_update_checksum(0, mm):08x}"
+        except (OSError, ValueError):
+            pass  # mmap indisponible: lecture par blocs ci-dessous
+        
+        buffer = _get_hash_buffer()
+        view = memoryview(buffer)
+        crc = 0
         try:
-            with open(file_path, "rb") as f:
-                for chunk in iter(lambda: f.read(4096), b""):
-                    hash_md5.update(chunk)
-            return hash_md5.hexdigest()
-        except:
+            with open(file_path, "rb", buffering=0) as f:
+                while True:
+                    size = f.readinto(buffer)
+                    if not size:
+                        break
+                    crc = _update_checksum(crc, view[:size])
+            return f"{crc:08x}"
+        except OSError:
             return ""
 
+    def _copy_with_checksum(self, src: Path, dst: Path) -> str:
+        """Copie src vers dst (métadonnées comprises) en calculant au passage sa somme de contrôle"""
+        buffer = _get_hash_buffer()
+        view = memoryview(buffer)
+        crc = 0
+        with open(src, "rb", buffering=0) as fsrc, open(dst, "wb") as fdst:
+            while True:
+                size = fsrc.readinto(buffer)
+                if not size:
+                    break
+                chunk = view[:size]
+                crc = _update_checksum(crc, chunk)
+                fdst.write(chunk)
+        shutil.copystat(src, dst)
+        return f"{crc:08x}"
+
     def inject_translations(
         self, 
         translation_data: Dict, 
@@ -90,38 +423,54 @@ class UnityTextInjector:
         self.success_count = 0
         self.error_count = 0
         self.processed_files.clear()
+        self.written_files.clear()
         
         # Filtrer uniquement les traductions valides
         translated_entries = self._filter_valid_translations(translation_data['texts'])
-        total_translations = len(translated_entries)
+        
+        # Grouper par fichier source (et dédoublonner) en une seule passe
+        files_to_process = self._group_by_source_file(translated_entries)
+        total_translations = sum(len(entries) for entries in files_to_process.values())
         
         if total_translations == 0:
-            print("❌ Aucune traduction valide à injecter")
+            self._log("❌ Aucune traduction valide à injecter", always=True)
+            self._flush_log()
             return 0
             
-        print(f"\n🚀 Début de l'injection de {total_translations} traductions")
-        print(f"📂 Sauvegardes dans: {self.backup_dir}")
+        self._log(f"\n🚀 Début de l'injection de {total_translations} traductions")
+        self._log(f"📂 Sauvegardes dans: {self.backup_dir}")
         
-        # Grouper par fichier source pour optimiser
-        files_to_process = self._group_by_source_file(translated_entries)
-        
-        for i, (source_file, text_entries) in enumerate(files_to_process.items()):
-            if progress_callback:
-                progress = (i / len(files_to_process)) * 100
-                progress_callback(
-                    progress, 
-                    f"Injection dans: {Path(source_file).name} ({len(text_entries)} textes)"
-                )
+        # L'archive est toujours fermée (marqueur de fin écrit), même si l'injection échoue
+        try:
+            # L'archive .tar ne peut pas être partagée entre processus: injection séquentielle
+            if self.max_workers > 1 and not self.archive_backups and len(files_to_process) > 1:
+                self._inject_files_parallel(files_to_process, progress_callback)
+                files_to_process = {}
             
-            print(f"\n📁 Fichier {i + 1}/{len(files_to_process)}: {Path(source_file).name}")
+            for i, (source_file, text_entries) in enumerate(files_to_process.items()):
+                file_name = os.path.basename(source_file)
+                if progress_callback:
+                    progress = (i / len(files_to_process)) * 100
+                    progress_callback(
+                        progress, 
+                        f"Injection dans: {file_name} ({len(text_entries)} textes)"
+                    )
             
-            if self._inject_file_translations(source_file, text_entries):
-                self.success_count += len(text_entries)
-                print(f"   ✅ {len(text_entries)} traduction(s) injectée(s)")
-            else:
-                self.error_count += len(text_entries)
-                print(f"   ❌ Échec de l'injection")
+                self._log(f"\n📁 Fichier {i + 1}/{len(files_to_process)}: {file_name}")
+            
+                if self._inject_file_translations(source_file, text_entries):
+                    self.success_count += len(text_entries)
+                    self._log(f"   ✅ {len(text_entries)} traduction(s) injectée(s)")
+                else:
+                    self.error_count += len(text_entries)
+                    self._log(f"   ❌ Échec de l'injection", always=True)
+            
+                # Une seule écriture sur la sortie par fichier traité
+                self._flush_log()
+        finally:
+            self.close_backup_archive()
         
+        self._sync_written_files()
         self._print_summary()
         
         if progress_callback:
@@ -132,9 +481,63 @@ class UnityTextInjector:
         
         return self.success_count
 
+    def _inject_files_parallel(
+        self, 
+        files_to_process: Dict[str, List[Dict]], 
+        progress_callback: Optional[Callable] = None
+    ) -> None:
+        """Injecte chaque fichier source dans un processus séparé et agrège les résultats"""
+        total_files = len(files_to_process)
+        worker_count = min(self.max_workers, total_files)
+        
+        with ProcessPoolExecutor(max_workers=worker_count) as executor:
+            futures = {
+                executor.submit(
+                    _inject_file_worker,
+                    (str(self.game_path), str(self.backup_dir), self.verbose, 
+                     self.verify_level, self.link_backups, source_file, text_entries)
+                ): source_file
+                for source_file, text_entries in files_to_process.items()
+            }
+            
+            for i, future in enumerate(as_completed(futures)):
+                source_file = futures[future]
+                text_entries = files_to_process[source_file]
+                file_name = os.path.basename(source_file)
+                
+                if progress_callback:
+                    progress_callback(
+                        (i / total_files) * 100, 
+                        f"Injection dans: {file_name} ({len(text_entries)} textes)"
+                    )
+                
+                self._log(f"\n📁 Fichier {i + 1}/{total_files}: {file_name}")
+                try:
+                    success, written_files, worker_log = future.result()
+                except Exception as e:
+                    success, written_files, worker_log = False, [], ""
+                    self._log(f"   ❌ Erreur du processus d'injection: {e}", always=True)
+                
+                if worker_log:
+                    self._log(worker_log, always=True)
+                self.written_files.extend(written_files)
+                
+                if success:
+                    self.processed_files.add(str(Path(source_file)))
+                    self.success_count += len(text_entries)
+                    self._log(f"   ✅ {len(text_entries)} traduction(s) injectée(s)")
+                else:
+                    self.error_count += len(text_entries)
+                    self._log(f"   ❌ Échec de l'injection", always=True)
+                
+                self._flush_log()
+
     def _filter_valid_translations(self, texts: List[Dict]) -> List[Dict]:
         """Filtre les traductions valides"""
         valid_translations = []
+        # Un seul stat() par fichier source, même s'il porte des milliers d'entrées
+        existing_files: Dict[str, bool] = {}
+        missing_counts: Dict[str, int] = {}
         
         for text_entry in texts:
             # Vérifications de validité
@@ -149,21 +552,42 @@ class UnityTextInjector:
                 
             # Vérifier que le fichier source existe
             source_file = text_entry.get('source_file', '')
-            if not source_file or not Path(source_file).exists():
-                print(f"⚠️ Fichier source manquant pour: {text_entry.get('asset_name', 'inconnu')}")
+            if source_file and source_file not in existing_files:
+                existing_files[source_file] = Path(source_file).exists()
+            if not source_file or not existing_files[source_file]:
+                missing_counts[source_file] = missing_counts.get(source_file, 0) + 1
                 continue
                 
             valid_translations.append(text_entry)
+        
+        # Un avertissement récapitulatif par fichier manquant plutôt qu'un par entrée
+        if missing_counts:
+            total_missing = sum(missing_counts.values())
+            self._log(f"⚠️ {total_missing} traduction(s) ignorée(s): fichier source manquant", always=True)
+            for source_file, count in missing_counts.items():
+                self._log(f"   - {source_file or '(non renseigné)'}: {count} entrée(s)")
             
         return valid_translations
 
     def _group_by_source_file(self, text_entries: List[Dict]) -> Dict[str, List[Dict]]:
-        """Groupe les entrées par fichier source"""
-        files_to_process = {}
+        """
+        Groupe les entrées par fichier source en ne gardant que la dernière
+        entrée pour chaque cible (path_id, champ) de ce fichier.
+        Les entrées sans path_id (fichiers texte) sont toutes conservées.
+        """
+        files_to_process: Dict[str, Dict] = {}
         for text_entry in text_entries:
-            source_file = text_entry['source_file']
-            files_to_process.setdefault(source_file, []).append(text_entry)
-        return files_to_process
+            path_id = text_entry.get('path_id')
+            if path_id is None:
+                # Pas de cible identifiable: clé propre à l'entrée, aucun dédoublonnage
+                key = id(text_entry)
+            else:
+                key = (path_id, text_entry.get('field_path', ''))
+            files_to_process.setdefault(text_entry['source_file'], {})[key] = text_entry
+        return {
+            source_file: list(entries.values())
+            for source_file, entries in files_to_process.items()
+        }
 
     def _inject_file_translations(self, source_file: str, text_entries: List[Dict]) -> bool:
         """Injecte les traductions dans un fichier spécifique"""
@@ -172,22 +596,22 @@ class UnityTextInjector:
             
             # Éviter de traiter le même fichier plusieurs fois
             if str(file_path) in self.processed_files:
-                print(f"   ⚠️ Fichier déjà traité: {file_path.name}")
+                self._log(f"   ⚠️ Fichier déjà traité: {file_path.name}")
                 return True
                 
             # Vérifier les permissions avant de continuer
             if not os.access(file_path, os.R_OK | os.W_OK):
-                print(f"   ❌ Permissions insuffisantes: {file_path}")
+                self._log(f"   ❌ Permissions insuffisantes: {file_path}", always=True)
                 return False
             
             # Créer une sauvegarde
             if not self.create_backup(file_path):
-                print(f"   ❌ Impossible de créer une sauvegarde, abandon")
+                self._log(f"   ❌ Impossible de créer une sauvegarde, abandon", always=True)
                 return False
             
             # Traiter selon le type de fichier
             success = False
-            if file_path.suffix.lower() in ['.assets', '.bundle', '.resource', '.resS', '.dat']:
+            if file_path.suffix.lower() in UNITY_EXTENSIONS:
                 success = self._inject_unity_file(file_path, text_entries)
             else:
                 success = self._inject_text_file(file_path, text_entries)
@@ -198,7 +622,7 @@ class UnityTextInjector:
             return success
             
         except Exception as e:
-            print(f"   ❌ Erreur lors de l'injection dans {source_file}: {e}")
+            self._log(f"   ❌ Erreur lors de l'injection dans {source_file}: {e}", always=True)
             return False
 
     def _inject_unity_file(self, file_path: Path, text_entries: List[Dict]) -> bool:
@@ -209,64 +633,81 @@ class UnityTextInjector:
             try:
                 env = UnityPy.load(str(file_path))
             except Exception as e:
-                print(f"   ❌ Impossible de charger le fichier Unity: {e}")
+                self._log(f"   ❌ Impossible de charger le fichier Unity: {e}", always=True)
                 return False
             
             modified = False
             modifications_count = 0
+            touched_ids = set()
             
-            # Indexer les entrées par path_id pour accélérer
-            entries_by_path_id = {
-                e['path_id']: e for e in text_entries 
-                if e.get('path_id') is not None
-            }
+            # Indexer les entrées par path_id (plusieurs champs possibles par objet)
+            entries_by_path_id = {}
+            for e in text_entries:
+                if e.get('path_id') is not None:
+                    entries_by_path_id.setdefault(e['path_id'], []).append(e)
             
-            # Parcourir les objets Unity
-            for obj in env.objects:
-                if obj.path_id in entries_by_path_id:
-                    text_entry = entries_by_path_id[obj.path_id]
-                    
+            # Indexer les objets Unity une seule fois, puis ne visiter que les cibles
+            obj_index = self._build_object_index(env)
+            
+            for path_id, object_entries in entries_by_path_id.items():
+                # Dans un bundle, plusieurs fichiers sérialisés peuvent partager un path_id:
+                # comme l'ancien parcours linéaire, tous les objets correspondants sont modifiés
+                for obj in obj_index.get(path_id, ()):
                     try:
-                        if obj.type.name == "TextAsset":
-                            if self._modify_text_asset(obj, text_entry):
+                        # Comparaison d'entiers (ClassID) plutôt que des noms de type
+                        obj_type = obj.type
+                        if obj_type not in INJECTABLE_TYPES:
+                            continue
+                        
+                        # Une seule lecture de l'objet, partagée par les helpers
+                        data = obj.read()
+                        if obj_type == ClassIDType.TextAsset:
+                            # Un TextAsset n'a qu'un contenu: la dernière entrée l'emporte
+                            if self._modify_text_asset(obj, data, object_entries[-1]):
                                 modified = True
                                 modifications_count += 1
-                        elif obj.type.name == "MonoBehaviour":
-                            if self._modify_monobehaviour(obj, text_entry):
+                                touched_ids.add(path_id)
+                        else:
+                            applied = self._modify_monobehaviour(data, object_entries)
+                            if applied:
                                 modified = True
-                                modifications_count += 1
+                                modifications_count += applied
+                                touched_ids.add(path_id)
                     except Exception as obj_error:
-                        print(f"   ⚠️ Erreur objet {obj.path_id}: {obj_error}")
+                        self._log(f"   ⚠️ Erreur objet {path_id}: {obj_error}")
                         continue
             
             # Sauvegarder si des modifications ont été apportées
             if modified and modifications_count > 0:
                 try:
-                    temp_file = file_path.with_suffix('.tmp')
+                    # Sérialiser puis vérifier en mémoire, avant toute écriture disque
+                    new_bytes = env.file.save()
+                    object_count = sum(map(len, obj_index.values()))
+                    if not self._verify_unity_file_integrity(new_bytes, touched_ids, object_count):
+                        self._log(f"   ❌ Données sérialisées corrompues", always=True)
+                        return False
                     
-                    # Sauvegarder dans un fichier temporaire
+                    # Une seule écriture dans le fichier temporaire, propre à ce fichier
+                    # (ui.bundle et ui.assets, traités en parallèle, ne partagent pas ui.tmp)
+                    temp_file = file_path.with_name(file_path.name + '.tmp')
                     with open(temp_file, "wb") as f:
-                        f.write(env.file.save())
-                    
-                    # Vérifier l'intégrité du fichier temporaire
-                    if not self._verify_unity_file_integrity(temp_file):
-                        print(f"   ❌ Fichier temporaire corrompu")
-                        return False
+                        f.write(new_bytes)
                     
                     # Remplacer l'original par le fichier temporaire
-                    shutil.move(str(temp_file), str(file_path))
-                    print(f"   ✅ Fichier modifié avec succès ({modifications_count} modifications)")
+                    _replace_file(temp_file, file_path)
+                    self.written_files.append(file_path)
+                    self._log(f"   ✅ Fichier modifié avec succès ({modifications_count} modifications)")
                     return True
                     
                 except Exception as save_error:
-                    print(f"   ❌ Erreur lors de la sauvegarde: {save_error}")
+                    self._log(f"   ❌ Erreur lors de la sauvegarde: {save_error}", always=True)
                     return False
             else:
-                print(f"   ℹ️ Aucune modification appliquée")
+                self._log(f"   ℹ️ Aucune modification appliquée")
                 return True
                 
         except Exception as e:
-            print(f"   ❌ Erreur générale lors de l'injection: {e}")
+            self._log(f"   ❌ Erreur générale lors de l'injection: {e}", always=True)
             return False
             
         finally:
@@ -274,35 +715,86 @@ class UnityTextInjector:
             if temp_file and temp_file.exists():
                 try:
                     temp_file.unlink()
-                except:
+                except OSError:
                     pass
 
-    def _verify_unity_file_integrity(self, file_path: Path) -> bool:
-        """Vérifie que le fichier Unity peut être chargé sans erreur"""
+    @staticmethod
+    def _build_object_index(env) -> Dict[int, List]:
+        """
+        Indexe les objets d'un environnement UnityPy par path_id (un seul parcours).
+        Un path_id n'est unique que dans son fichier sérialisé: chaque clé donne une liste.
+        """
+        obj_index: Dict[int, List] = {}
+        for obj in env.objects:
+            obj_index.setdefault(obj.path_id, []).append(obj)
+        return obj_index
+
+    def _verify_unity_file_integrity(
+        self, 
+        source, 
+        target_ids: Optional[set] = None, 
+        expected_objects: Optional[int] = None
+    ) -> bool:
+        """Vérifie que le fichier Unity peut être chargé sans erreur
+        
+        source est soit un chemin, soit le contenu déjà sérialisé (bytes),
+        vérifié alors sans relecture disque. Si target_ids est fourni, seuls
+        ces objets (ceux qui viennent d'être modifiés) sont relus et tous doivent
+        être lisibles; expected_objects contrôle en plus le nombre d'objets.
+        Le résultat d'une vérification complète d'un fichier est mis en cache
+        tant que sa date de modification et sa taille ne changent pas.
+        """
+        cache_key = None
         try:
-            with open(file_path, "rb") as f:
-                env = UnityPy.load(f)
+            if isinstance(source, (bytes, bytearray)):
+                stream = io.BytesIO(source)
+            else:
+                if target_ids is None:
+                    st = os.stat(source)
+                    cache_key = (str(source), st.st_mtime_ns, st.st_size)
+                    if cache_key in self._loadable_cache:
+                        return self._loadable_cache[cache_key]
+                stream = open(source, "rb")
+            with stream:
+                env = UnityPy.load(stream)
                 readable_objects = 0
                 
-                for obj in env.objects:
+                if target_ids is None:
+                    objects_to_check = env.objects
+                else:
+                    obj_index = self._build_object_index(env)
+                    object_count = sum(map(len, obj_index.values()))
+                    if expected_objects is not None and object_count < expected_objects:
+                        self._log(f"   ⚠️ Objets manquants: {object_count}/{expected_objects}")
+                        return False
+                    if not all(pid in obj_index for pid in target_ids):
+                        self._log(f"   ⚠️ Objets modifiés introuvables après sérialisation")
+                        return False
+                    objects_to_check = [obj for pid in target_ids for obj in obj_index[pid]]
+                
+                for obj in objects_to_check:
                     try:
                         _ = obj.read()
                         readable_objects += 1
-                    except:
+                    except Exception:
                         continue
             
-            print(f"   🔍 Vérification intégrité: {readable_objects} objets lisibles")
-            return readable_objects > 0
+            self._log(f"   🔍 Vérification intégrité: {readable_objects} objets lisibles")
+            if target_ids is not None:
+                return readable_objects == len(objects_to_check)
+            result = readable_objects > 0
             
         except Exception as e:
-            print(f"   ⚠️ Problème d'intégrité détecté: {e}")
-            return False
+            self._log(f"   ⚠️ Problème d'intégrité détecté: {e}")
+            result = False
+        
+        if cache_key is not None:
+            self._loadable_cache[cache_key] = result
+        return result
 
-    def _modify_text_asset(self, obj, text_entry: Dict) -> bool:
-        """Modifie un TextAsset de manière sécurisée"""
+    def _modify_text_asset(self, obj, data, text_entry: Dict) -> bool:
+        """Modifie un TextAsset (déjà lu via obj.read()) de manière sécurisée"""
         try:
-            data = obj.read()
-            
             # Vérifier que c'est le bon asset
             asset_name = self._get_asset_name(data, obj)
             if asset_name != text_entry['asset_name']:
@@ -312,225 +804,259 @@ class UnityTextInjector:
             old_content = self._get_asset_content(data)
             new_content = text_entry['translated_text']
             
-            print(f"    📝 Modification TextAsset: {asset_name}")
-            print(f"      Ancien: {old_content[:50]}{'...' if len(old_content) > 50 else ''}")
-            print(f"      Nouveau: {new_content[:50]}{'...' if len(new_content) > 50 else ''}")
-            
-            # Modifier le contenu selon le type de données
-            success = False
+            self._log(f"    📝 Modification TextAsset: {asset_name}")
+            self._log(f"      Ancien: {old_content[:50]}{'...' if len(old_content) > 50 else ''}")
+            self._log(f"      Nouveau: {new_content[:50]}{'...' if len(new_content) > 50 else ''}")
             
-            if hasattr(data, 'text'):
-                data.text = new_content
-                success = True
-            elif hasattr(data, 'm_Script'):
-                # Respecter le type original (bytes ou str)
-                if isinstance(data.m_Script, (bytes, bytearray)):
-                    data.m_Script = new_content.encode('utf-8') if isinstance(new_content, str) else new_content
-                else:
-                    data.m_Script = new_content if isinstance(new_content, str) else new_content.decode('utf-8', errors='ignore')
-                success = True
-            elif hasattr(data, 'bytes'):
-                # Respecter le type original (bytes ou str)
-                if isinstance(data.bytes, (bytes, bytearray)):
-                    data.bytes = new_content.encode('utf-8') if isinstance(new_content, str) else new_content
-                else:
-                    data.bytes = new_content if isinstance(new_content, str) else new_content.decode('utf-8', errors='ignore')
-                success = True
+            # Modifier le premier champ de contenu présent, en respectant son type
+            for attr in ('text', 'm_Script', 'bytes'):
+                if hasattr(data, attr):
+                    target_type = type(getattr(data, attr))
+                    setattr(data, attr, self._convert_to_type(new_content, target_type))
+                    break
             else:
-                print(f"      ⚠️ Type de données non supporté pour {asset_name}")
+                self._log(f"      ⚠️ Type de données non supporté pour {asset_name}")
                 return False
             
-            if success:
-                try:
-                    data.save()
-                    print("      ✓ TextAsset modifié avec succès")
-                    return True
-                except Exception as save_error:
-                    print(f"      ✗ Erreur lors de la sauvegarde: {save_error}")
-                    return False
+            try:
+                data.save()
+                self._log("      ✓ TextAsset modifié avec succès")
+                return True
+            except Exception as save_error:
+                self._log(f"      ✗ Erreur lors de la sauvegarde: {save_error}")
+                return False
                     
         except Exception as e:
-            print(f"    ❌ Erreur lors de la modification du TextAsset: {e}")
+            self._log(f"    ❌ Erreur lors de la modification du TextAsset: {e}", always=True)
             return False
 
-    def _modify_monobehaviour(self, obj, text_entry: Dict) -> bool:
-        """Modifie un MonoBehaviour de manière sécurisée"""
+    def _convert_to_type(self, value, target_type):
+        """Convertit value vers target_type (str/bytes/bytearray), sans copie si déjà du bon type"""
+        if type(value) is target_type:
+            return value
+        converter = self._CONVERTERS.get(target_type)
+        return converter(value) if converter else value
+
+    def _modify_monobehaviour(self, data, text_entries: List[Dict]) -> int:
+        """
+        Applique toutes les traductions d'un MonoBehaviour (déjà lu via obj.read())
+        avec une seule lecture et une seule écriture du TypeTree.
+        Retourne le nombre de champs modifiés.
+        """
         try:
-            data = obj.read()
-            field_path = text_entry.get('field_path', '')
+            # Lire les données (from_typetree: faux si seuls les attributs directs ont été lus)
+            mono_data, from_typetree = self._read_mono_data(data)
+            if not mono_data:
+                self._log("      ⚠️ Impossible de lire les données MonoBehaviour")
+                return 0
             
-            if not field_path:
-                print("      ⚠️ Chemin de champ manquant pour MonoBehaviour")
-                return False
+            # Modifier chaque valeur dans le chemin spécifié
+            applied = 0
+            modified_fields = set()
+            for text_entry in text_entries:
+                field_path = text_entry.get('field_path', '')
+                if not field_path:
+                    self._log("      ⚠️ Chemin de champ manquant pour MonoBehaviour")
+                    continue
+                
+                if self._set_nested_value(mono_data, field_path, text_entry['translated_text']):
+                    applied += 1
+                    modified_fields.add(self._compile_path(field_path)[0][0])
+                    self._log(f"      ✓ Champ modifié: {field_path}")
+                else:
+                    self._log(f"      ⚠️ Impossible de modifier le champ: {field_path}")
             
-            # Lire les données
-            mono_data = self._read_mono_data(data)
-            if not mono_data:
-                print("      ⚠️ Impossible de lire les données MonoBehaviour")
-                return False
+            if applied == 0:
+                return 0
             
-            # Modifier la valeur dans le chemin spécifié
-            if self._set_nested_value(mono_data, field_path, text_entry['translated_text']):
-                # Sauvegarder les modifications
-                try:
-                    if hasattr(data, 'save'):
-                        data.save()
-                        print(f"      ✓ MonoBehaviour modifié: {field_path}")
-                        return True
-                    else:
-                        print("      ⚠️ Impossible de sauvegarder MonoBehaviour")
-                        return False
-                except Exception as save_error:
-                    print(f"      ✗ Erreur sauvegarde MonoBehaviour: {save_error}")
-                    return False
-            else:
-                print(f"      ⚠️ Impossible de modifier le champ: {field_path}")
-                return False
+            # Sauvegarder les modifications en une fois
+            try:
+                if from_typetree and hasattr(data, 'save_typetree'):
+                    data.save_typetree(mono_data)
+                elif hasattr(data, 'save'):
+                    # Dictionnaire partiel d'attributs: pas un TypeTree complet, on
+                    # replace les champs modifiés sur l'objet avant de le sauvegarder
+                    if not from_typetree:
+                        for field in modified_fields:
+                            setattr(data, field, mono_data[field])
+                    data.save()
+                else:
+                    self._log("      ⚠️ Impossible de sauvegarder MonoBehaviour")
+                    return 0
+                self._log(f"      ✓ MonoBehaviour modifié: {applied} champ(s)")
+                return applied
+            except Exception as save_error:
+                self._log(f"      ✗ Erreur sauvegarde MonoBehaviour: {save_error}")
+                return 0
                 
         except Exception as e:
-            print(f"    ❌ Erreur lors de la modification du MonoBehaviour: {e}")
-            return False
+            self._log(f"    ❌ Erreur lors de la modification du MonoBehaviour: {e}", always=True)
+            return 0
 
     def _inject_text_file(self, file_path: Path, text_entries: List[Dict]) -> bool:
         """Injecte les traductions dans un fichier texte"""
         try:
             # Pour les fichiers texte, on remplace tout le contenu
             if len(text_entries) == 1:
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(text_entries[0]['translated_text'])
-                print(f"    ✓ Fichier texte modifié: {file_path.name}")
+                # Encodage unique puis écriture binaire et remplacement atomique
+                data = text_entries[0]['translated_text'].encode('utf-8')
+                temp_file = file_path.with_name(file_path.name + '.tmp')
+                temp_file.write_bytes(data)
+                _replace_file(temp_file, file_path)
+                self.written_files.append(file_path)
+                self._log(f"    ✓ Fichier texte modifié: {file_path.name}")
                 return True
             else:
-                print(f"    ⚠️ Plusieurs entrées pour un fichier texte: {file_path.name}")
+                self._log(f"    ⚠️ Plusieurs entrées pour un fichier texte: {file_path.name}")
                 return False
                 
         except Exception as e:
-            print(f"    ❌ Erreur lors de la modification du fichier texte {file_path}: {e}")
+            self._log(f"    ❌ Erreur lors de la modification du fichier texte {file_path}: {e}", always=True)
             return False
 
-    def _read_mono_data(self, data) -> Optional[Dict]:
-        """Lit les données MonoBehaviour de manière robuste"""
+    def _read_mono_data(self, data) -> Tuple[Optional[Dict], bool]:
+        """
+        Lit les données MonoBehaviour de manière robuste.
+        Retourne (données, lues_via_typetree).
+        """
         try:
             if hasattr(data, 'read_typetree'):
-                return data.read_typetree()
+                return data.read_typetree(), True
         except Exception as e:
-            print(f"      ⚠️ Erreur read_typetree: {e}")
+            self._log(f"      ⚠️ Erreur read_typetree: {e}")
         
         # Fallback: essayer de lire les attributs directs
         try:
+            cls = type(data)
+            class_attrs = self._mono_attr_cache.get(cls)
+            if class_attrs is None:
+                class_attrs = tuple(
+                    attr for attr in dir(cls)
+                    if not attr.startswith('_') and attr not in ('read', 'read_typetree')
+                )
+                self._mono_attr_cache[cls] = class_attrs
+            
+            # Les champs du TypeTree sont des attributs d'instance, propres à chaque objet
+            instance_attrs = [
+                attr for attr in getattr(data, '__dict__', ())
+                if not attr.startswith('_') and attr not in class_attrs
+            ]
+            
             mono_data = {}
-            for attr in dir(data):
-                if not attr.startswith('_') and attr not in ['read', 'read_typetree']:
-                    try:
-                        value = getattr(data, attr)
-                        if isinstance(value, (str, int, float, bool, list, dict)):
-                            mono_data[attr] = value
-                    except:
-                        continue
-            return mono_data if mono_data else None
-        except:
-            return None
+            for attr in (*class_attrs, *instance_attrs):
+                try:
+                    value = getattr(data, attr, MISSING)
+                except Exception:
+                    continue
+                if value is not MISSING and isinstance(value, _PRIMITIVES):
+                    mono_data[attr] = value
+            return (mono_data if mono_data else None), False
+        except Exception:
+            return None, False
 
     def _get_asset_name(self, data, obj) -> str:
         """Obtient le nom d'un asset de manière robuste"""
-        if hasattr(data, 'name') and data.name:
-            return data.name
-        elif hasattr(data, 'm_Name') and data.m_Name:
-            return data.m_Name
-        elif hasattr(obj, 'name') and obj.name:
-            return obj.name
-        else:
-            return f"Asset_{obj.path_id}"
+        return (
+            getattr(data, 'name', None)
+            or getattr(data, 'm_Name', None)
+            or getattr(obj, 'name', None)
+            or f"Asset_{obj.path_id}"
+        )
 
     def _get_asset_content(self, data) -> str:
         """Obtient le contenu d'un asset de manière robuste"""
-        if hasattr(data, 'text') and data.text:
-            return data.text
-        elif hasattr(data, 'm_Script') and data.m_Script:
-            # Gérer le cas où m_Script est en bytes
-            if isinstance(data.m_Script, (bytes, bytearray)):
-                try:
-                    return data.m_Script.decode('utf-8', errors='ignore')
-                except:
-                    return str(data.m_Script)
-            else:
-                return str(data.m_Script)
-        elif hasattr(data, 'bytes') and data.bytes:
-            try:
-                return data.bytes.decode('utf-8', errors='ignore')
-            except:
-                return str(data.bytes)
+        text = getattr(data, 'text', None)
+        if text:
+            return text
+        
+        script = getattr(data, 'm_Script', None)
+        if script:
+            # Gérer le cas où m_Script est en bytes (errors='ignore': le décodage ne lève pas)
+            if isinstance(script, (bytes, bytearray)):
+                return script.decode('utf-8', errors='ignore')
+            return str(script)
+        
+        raw_bytes = getattr(data, 'bytes', None)
+        if raw_bytes:
+            if isinstance(raw_bytes, (bytes, bytearray)):
+                return raw_bytes.decode('utf-8', errors='ignore')
+            return str(raw_bytes)
         return ""
 
+    def _compile_path(self, path: str) -> Tuple[Tuple[str, Optional[int]], ...]:
+        """Découpe un chemin 'a.b[2].c' en étapes (clé, index ou None), une seule fois par chemin"""
+        steps = self._path_cache.get(path)
+        if steps is None:
+            # Noms internés: comparaison par identité lors des recherches dans les dict
+            steps = tuple(
+                (sys.intern(name), int(index) if index else None)
+                for name, index in _PATH_STEP_RE.findall(path)
+            )
+            self._path_cache[path] = steps
+        return steps
+
     def _set_nested_value(self, data: Dict, path: str, value: str) -> bool:
         """Définit une valeur dans un objet imbriqué de manière sécurisée"""
-        try:
-            keys = path.split('.')
-            current = data
-            
-            # Naviguer jusqu'au dernier niveau
-            for key in keys[:-1]:
-                if '[' in key and ']' in key:
-                    # Gérer les indices de tableau
-                    field_name = key.split('[')[0]
-                    index = int(key.split('[')[1].split(']')[0])
-                    
-                    if field_name not in current:
-                        print(f"      ⚠️ Champ manquant: {field_name}")
-                        return False
-                        
-                    if not isinstance(current[field_name], list):
-                        print(f"      ⚠️ {field_name} n'est pas une liste")
-                        return False
-                        
-                    if index >= len(current[field_name]):
-                        print(f"      ⚠️ Index {index} hors limites pour {field_name}")
-                        return False
-                        
-                    current = current[field_name][index]
-                else:
-                    if key not in current:
-                        print(f"      ⚠️ Clé manquante: {key}")
-                        return False
-                    current = current[key]
+        steps = self._compile_path(path)
+        if not steps:
+            self._log(f"      ⚠️ Chemin de champ invalide: {path}")
+            return False
+        
+        current = data
+        last_step = len(steps) - 1
+        for position, (key, index) in enumerate(steps):
+            if not isinstance(current, dict):
+                self._log(f"      ⚠️ {key}: le parent n'est pas un objet")
+                return False
             
-            # Définir la valeur finale
-            final_key = keys[-1]
-            if '[' in final_key and ']' in final_key:
-                field_name = final_key.split('[')[0]
-                index = int(final_key.split('[')[1].split(']')[0])
-                
-                if field_name not in current or not isinstance(current[field_name], list):
-                    print(f"      ⚠️ Problème avec le champ final: {field_name}")
-                    return False
-                    
-                if index >= len(current[field_name]):
-                    print(f"      ⚠️ Index final {index} hors limites")
-                    return False
-                    
-                current[field_name][index] = value
-            else:
-                if final_key not in current:
-                    print(f"      ⚠️ Clé finale manquante: {final_key}")
-                    return False
-                current[final_key] = value
+            child = current.get(key, MISSING)
+            if child is MISSING:
+                self._log(f"      ⚠️ Clé manquante: {key}")
+                return False
             
-            return True
+            if index is None:
+                if position == last_step:
+                    current[key] = value
+                    return True
+                current = child
+                continue
             
-        except Exception as e:
-            print(f"      ❌ Erreur lors de la définition de la valeur {path}: {e}")
-            return False
+            # Gérer les indices de tableau
+            if not isinstance(child, list):
+                self._log(f"      ⚠️ {key} n'est pas une liste")
+                return False
+            if index >= len(child):
+                self._log(f"      ⚠️ Index {index} hors limites pour {key}")
+                return False
+            
+            if position == last_step:
+                child[index] = value
+                return True
+            current = child[index]
+        
+        return False
+
+    def _sync_written_files(self) -> None:
+        """Force l'écriture sur disque des seuls fichiers modifiés, en fin d'injection"""
+        # Pas de os.sync(): il viderait tous les tampons du système, pas seulement les nôtres
+        for file_path in self.written_files:
+            try:
+                with open(file_path, 'rb+') as f:
+                    os.fsync(f.fileno())
+            except OSError as e:
+                self._log(f"⚠️ Impossible de synchroniser {file_path}: {e}", always=True)
 
     def _print_summary(self) -> None:
         """Affiche un résumé de l'injection"""
-        print(f"\n🏁 Résumé de l'injection:")
-        print(f"   ✅ Réussies: {self.success_count}")
-        print(f"   ❌ Échecs: {self.error_count}")
-        print(f"   📁 Fichiers traités: {len(self.processed_files)}")
-        print(f"   📂 Sauvegardes dans: {self.backup_dir}")
+        self._log(f"\n🏁 Résumé de l'injection:", always=True)
+        self._log(f"   ✅ Réussies: {self.success_count}", always=True)
+        self._log(f"   ❌ Échecs: {self.error_count}", always=True)
+        self._log(f"   📁 Fichiers traités: {len(self.processed_files)}", always=True)
+        self._log(f"   📂 Sauvegardes dans: {self.backup_dir}", always=True)
         
         if self.error_count > 0:
-            print(f"   ⚠️ Vérifiez les logs pour les détails des erreurs")
+            self._log(f"   ⚠️ Vérifiez les logs pour les détails des erreurs", always=True)
+        self._flush_log()
 
     def restore_backup(self, backup_timestamp: Optional[str] = None) -> bool:
         """Restaure les fichiers depuis une sauvegarde"""
@@ -539,31 +1065,112 @@ class UnityTextInjector:
                 backup_path = Path("backups") / backup_timestamp
             else:
                 backup_path = self.backup_dir
+            
+            archive_path = backup_path.with_suffix('.tar')
+            if not backup_path.exists() and archive_path.exists():
+                return self._restore_backup_archive(archive_path)
                 
             if not backup_path.exists():
-                print(f"❌ Dossier de sauvegarde introuvable: {backup_path}")
+                self._log(f"❌ Dossier de sauvegarde introuvable: {backup_path}", always=True)
                 return False
                 
+            # Lister d'abord les copies à faire, puis les exécuter en parallèle
+            # Chemins manipulés en chaînes: pas d'objet Path construit par fichier
+            backup_root = str(backup_path)
+            game_root = str(self.game_path)
+            copy_pairs = [
+                (backup_file, os.path.join(game_root, os.path.relpath(backup_file, backup_root)))
+                for backup_file in (entry.path for entry in iter_files(backup_root))
+            ]
+            
+            # Travail limité par les E/S: copy2 et les sommes de contrôle relâchent le GIL
+            max_workers = min(32, (os.cpu_count() or 1) * 4)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = list(executor.map(self._restore_one, copy_pairs))
+            
+            # Bilan et messages d'erreur dans le thread principal, une fois tout terminé
             restored_count = 0
-            for backup_file in backup_path.rglob('*'):
-                if backup_file.is_file():
-                    try:
-                        relative_path = backup_file.relative_to(backup_path)
-                        target_file = self.game_path / relative_path
-                        
-                        # Créer les dossiers parents si nécessaire
-                        target_file.parent.mkdir(parents=True, exist_ok=True)
-                        
-                        shutil.copy2(backup_file, target_file)
-                        restored_count += 1
-                        
-                    except Exception as e:
-                        print(f"⚠️ Erreur restauration {backup_file}: {e}")
-                        continue
+            for success, backup_file, error in results:
+                if success:
+                    restored_count += 1
+                else:
+                    self._log(f"⚠️ Erreur restauration {backup_file}: {error}", always=True)
             
-            print(f"✅ Restauration terminée: {restored_count} fichiers restaurés")
+            self._log(f"✅ Restauration terminée: {restored_count} fichiers restaurés", always=True)
             return True
             
         except Exception as e:
-            print(f"❌ Erreur lors de la restauration: {e}")
-            return False
\ No newline at end of file
+            self._log(f"❌ Erreur lors de la restauration: {e}", always=True)
+            return False
+        
+        finally:
+            self._flush_log()
+
+    def _restore_one(self, copy_pair) -> Tuple[bool, str, Optional[str]]:
+        """Restaure un fichier de sauvegarde (exécuté dans un thread): (succès, fichier, erreur)"""
+        backup_file, target_file = copy_pair
+        try:
+            # Fichier inchangé depuis la sauvegarde (ou lien physique): rien à copier
+            if self._is_same_content(backup_file, target_file):
+                return True, backup_file, None
+            
+            # Créer les dossiers parents si nécessaire
+            os.makedirs(os.path.dirname(target_file), exist_ok=True)
+            _fast_copy(backup_file, target_file)
+            return True, backup_file, None
+        except Exception as e:
+            return False, backup_file, str(e)
+
+    def _is_same_content(self, backup_file: str, target_file: str) -> bool:
+        """
+        Indique si la cible est identique à la sauvegarde. Une taille différente
+        suffit à conclure; sinon, hors lien physique vers le même fichier, les
+        sommes de contrôle sont toujours comparées (une date identique ne prouve
+        rien: un patch peut modifier le fichier en conservant sa date).
+        """
+        try:
+            target_stat = os.stat(target_file)
+        except FileNotFoundError:
+            return False
+        backup_stat = os.stat(backup_file)
+        
+        if backup_stat.st_size != target_stat.st_size:
+            return False
+        if os.path.samestat(backup_stat, target_stat):
+            return True
+        # Une somme vide signale une lecture impossible: jamais considérée identique
+        backup_checksum = self._calculate_checksum(backup_file)
+        return bool(backup_checksum) and backup_checksum == self._calculate_checksum(target_file)
+
+    def _restore_backup_archive(self, archive_path: Path) -> bool:
+        """Restaure les fichiers depuis une archive de sauvegarde .tar"""
+        if archive_path == self.backup_archive:
+            self.close_backup_archive()
+        
+        # Filtre 'data' quand disponible: refuse les chemins absolus et les liens
+        extract_kwargs = {'filter': 'data'} if hasattr(tarfile, 'data_filter') else {}
+        with tarfile.open(archive_path, mode='r') as tar:
+            members = [member for member in tar.getmembers() if member.isfile()]
+            tar.extractall(self.game_path, members=members, **extract_kwargs)
+        
+        self._log(f"✅ Restauration terminée: {len(members)} fichiers restaurés", always=True)
+        return True
+
+
+def _inject_file_worker(args) -> tuple:
+    """
+    Point d'entrée d'un processus du pool: injecte un seul fichier avec son propre
+    injecteur et renvoie (succès, fichiers écrits, journal) au processus principal
+    """
+    game_path, backup_dir, verbose, verify_level, link_backups, source_file, text_entries = args
+    injector = UnityTextInjector(
+        game_path, 
+        verbose=verbose, 
+        verify_level=verify_level, 
+        backup_dir=backup_dir,
+        link_backups=link_backups
+    )
+    # Le journal est renvoyé au processus principal, jamais écrit depuis le processus
+    injector._auto_flush = False
+    success = injector._inject_file_translations(source_file, text_entries)
+    return success, injector.written_files, '\n'.join(injector._log_buffer)
\ No newline at end of file
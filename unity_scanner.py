@@ -6,13 +6,55 @@ Version spécialisée pour bundles chiffrés/compressés et formats propriétair
 
 import os
 import re
+import sys
+import mmap
 from pathlib import Path
 import UnityPy
 from datetime import datetime
 import struct
 import json
+import gzip
 import zlib
+from itertools import islice
 import lz4.frame
+from fs_utils import iter_files, MISSING
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+# NumPy (optionnel): histogramme des octets vectorisé pour l'entropie
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+# ISA-L (optionnel): inflate gzip/zlib accéléré, même API que la bibliothèque standard
+try:
+    from isal import igzip as gzip_backend, isal_zlib as zlib_backend
+    ISAL_AVAILABLE = True
+except ImportError:
+    gzip_backend = gzip
+    zlib_backend = zlib
+    ISAL_AVAILABLE = False
+
+# Extensions reconnues (en minuscules, testées par appartenance sur la seule extension)
+# '.resS' n'a jamais pu correspondre à un nom en minuscules: les flux bruts restent exclus
+UNITY_EXTENSIONS = frozenset(('.assets', '.bundle', '.resource', '.dat'))
+TEXT_EXTENSIONS = frozenset(('.srt', '.json', '.xml', '.txt'))
+
+# Nombre maximal d'éléments examinés par liste MonoBehaviour (tables de localisation comprises)
+MONO_LIST_LIMIT = 5000
+
+# Nombre maximal d'occurrences comptées par pattern lors du scan approfondi (diagnostic)
+DEEP_SCAN_MATCH_LIMIT = 1000
+
+# Au-delà de cette taille, un bundle analysé est projeté en mémoire (mmap) plutôt que lu
+# (en dessous, la mise en place du mapping coûte plus qu'une lecture)
+BUNDLE_MMAP_MIN_SIZE = 1024 * 1024
+
+# Seul le début d'un contenu est examiné pour y chercher des patterns de dialogue
+DIALOGUE_SCAN_LIMIT = 64 * 1024
 
 # Importer le décodeur XOR
 try:
@@ -26,17 +68,130 @@ except ImportError as e:
 
 
 class UnityTextScanner:
-    def __init__(self, game_path, progress_callback=None):
+    # Table de traduction: octets non imprimables remplacés par '.'
+    _SAFE_ASCII_TABLE = bytes(b if 32 <= b <= 126 else 0x2E for b in range(256))
+    # Attributs utiles des données TextAsset (évite de parcourir dir() et toute la MRO)
+    _KNOWN_DATA_ATTRS = ('name', 'm_Name', 'text', 'm_Script', 'bytes', 'script')
+    # Propriétés porteuses de texte dans les MonoBehaviour IL2CPP
+    _IL2CPP_TEXT_PROPERTIES = (
+        'm_Text', 'text', 'content', 'value', 'message', 'dialogue',
+        'm_FontData', 'm_Material', 'm_Color', 'm_RaycastTarget',
+        'localizedString', 'localized', 'stringValue', 'textValue',
+        'displayText', 'uiText', 'labelText', 'buttonText',
+        'titleText', 'descriptionText', 'subtitleText'
+    )
+    # Types lourds sans texte traduisible: leur lecture (pixels, sommets, échantillons) est inutile
+    _SKIPPED_OBJECT_TYPES = frozenset((
+        "Texture2D", "Texture3D", "Texture2DArray", "Cubemap", "Sprite", "Mesh",
+        "AudioClip", "VideoClip", "AnimationClip", "Shader", "Material",
+    ))
+    # Signatures d'en-tête de bundle connues (aucune n'est préfixe d'une autre: l'ordre est libre)
+    _BUNDLE_SIGNATURES = (
+        (b'UnityFS', 'UnityFS Bundle'),
+        (b'UnityRaw', 'Unity Raw Bundle'),
+        (b'UnityWeb', 'Unity Web Bundle'),
+        (b'\x1f\x8b', 'GZip compressed'),
+        (b'PK', 'ZIP archive'),
+        (b'BZ', 'BZip2 compressed'),
+        (b'\x04\x22\x4d\x18', 'LZ4 compressed'),
+        (b'\x28\xb5\x2f\xfd', 'Zstandard compressed'),
+    )
+    # Lettres ASCII (exactement les caractères ASCII pour lesquels str.isalpha est vrai)
+    _ASCII_LETTERS = b'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz'
+    # Chaînes techniques (identifiants, versions, chemins...) fusionnées en une seule alternation
+    _TECHNICAL_RE = re.compile('|'.join(f'(?:{p})' for p in (
+        r'^[0-9a-fA-F]{8,}$',
+        r'^\d+\.\d+\.\d+',
+        r'^[A-Z_]{6,}$',
+        r'\.dll$|\.exe$|\.so$',
+        r'^m_[A-Z]',
+        r'^UnityEngine\.',
+        r'^System\.',
+        r'^\s*$',
+        r'^[<>/_\-=+*#@$%^&(){}[\]\\|;:,.\d\s]+$',
+        r'^(true|false|null)$',
+    )), re.IGNORECASE)
+    # Patterns spécifiques aux jeux (très permissifs), fusionnés de la même façon
+    _GAME_TEXT_RE = re.compile('|'.join(f'(?:{p})' for p in (
+        r'\b(you|your|player|character|game|level|score|points|health|mana|inventory)\b',
+        r'\b(click|press|select|choose|option|menu|settings|save|load)\b',
+        r'\b(dialogue|conversation|speak|talk|say|tell|ask|answer)\b',
+        r'[.!?]\s*$',
+        r'^[A-Z].*[a-z]',
+        r'\b(the|and|for|are|with|this|that|have|from|they|know|want|been|good|much|some|time|very|when|come|here|just|like|long|make|many|over|such|take|than|them|well|were)\b',  # Mots anglais courants
+        r'[a-zA-Z]+\s+[a-zA-Z]+',  # Au moins 2 mots
+        r'[\w\s]{15,}',  # Texte de longueur raisonnable
+    )), re.IGNORECASE)
+    # Extraction de chaînes depuis des données binaires
+    _UTF8_BYTES_RE = re.compile(rb'[\x20-\x7E\xC0-\xFD][\x20-\x7E\x80-\xFD]{3,100}')
+    _UTF16_BYTES_RE = re.compile(rb'(?:\x00[\x20-\x7E]){4,50}')
+    _JSON_BYTES_RE = re.compile(rb'\{"[^"]+"\s*:\s*"[^"]+"\s*[},]')
+    _JSON_VALUE_RE = re.compile(r':\s*"([^"]+)"')
+    # Scan approfondi des bundles
+    _DEEP_UTF16_RE = re.compile(rb'(?:\x00[A-Za-z]){4,}')
+    _DEEP_JSON_RE = re.compile(rb'\{"[^"]+"\s*:\s*"[^"]*"\s*[},]')
+    # Longueur préfixée plausible (5 < L < 500): l'octet de poids 1 vaut 0 ou 1. Toute longueur
+    # 32/64 bits valide l'est aussi en 16 bits, donc ce filtre couvre les trois formats.
+    _LENGTH_PREFIX_CANDIDATE_RE = re.compile(rb'(?=[\x06-\xff]\x00|[\x00-\xf3]\x01)', re.DOTALL)
+    _LENGTH_FORMATS = ((struct.Struct('<I'), 4), (struct.Struct('<H'), 2), (struct.Struct('<Q'), 8))
+    # Marqueurs de dialogue du scan approfondi
+    _DIALOGUE_MARKERS = (
+        b'dialogue', b'text', b'message', b'subtitle',
+        b'speaker', b'voice', b'conversation'
+    )
+    # Contenus SRT décodés
+    _SRT_TIMESTAMP_RE = re.compile(r'\d{2}:\d{2}:\d{2}')
+    _SRT_ENTRY_RE = re.compile(r'\d+\s*\n\d{2}:\d{2}:\d{2}')
+    # Séparateurs de chemin remplacés par '_' dans les identifiants de champs
+    _PATH_ID_TABLE = str.maketrans('.[]', '___')
+    # Chaque pattern de dialogue exige au moins un de ces caractères: filtre préalable en une classe
+    _DIALOGUE_MARKERS_RE = re.compile(r'["<:\[.!?]')
+
+    def __init__(self, game_path, progress_callback=None, max_workers=1):
         self.game_path = Path(game_path)
         self.found_texts = []
         self.progress_callback = progress_callback
+        # Nombre de processus pour le traitement des fichiers (1 = séquentiel)
+        self.max_workers = max(1, max_workers or os.cpu_count() or 1)
         self.warned_files = set()
+        # Horodatage commun à toutes les extractions d'un scan (rafraîchi par scan_directory)
+        self._scan_timestamp = datetime.now().isoformat()
         self.text_patterns = [
             r'subtitle', r'dialogue', r'dialog', r'caption', r'text',
             r'localization', r'translation', r'string', r'message',
             r'conversation', r'chat', r'speech', r'voice', r'line',
             r'story', r'scenario', r'script'
         ]
+        # Regex compilées une seule fois pour tout le scan
+        self._name_re = re.compile('|'.join(self.text_patterns), re.IGNORECASE)
+        # Résultat du test de nom par nom (les clés MonoBehaviour se répètent énormément)
+        self._name_relevance = {}
+        # Attributs de classe utiles par type Python (fallback MonoBehaviour sans typetree)
+        self._mono_attr_cache = {}
+        # Méthode de décompression retenue par bundle (None: échec), pour ne jamais décompresser deux fois
+        self._decompression_results = {}
+        dialogue_patterns = [
+            r'"text"\s*:\s*"[^"]+"',
+            r'<subtitle[^>]*>.*?</subtitle>',
+            r'\d{2}:\d{2}:\d{2}[,\.]\d{3}',
+            r'Dialogue:',
+            r'\[.*?\].*?:.*',
+            r'".*?"',
+            r'[A-Z][a-z]+\s*:\s*[A-Z]',
+            r'[.!?]\s*',
+        ]
+        # Une seule alternation: le texte n'est parcouru qu'une fois
+        self._dialogue_re = re.compile(
+            '(?:' + ')|(?:'.join(dialogue_patterns) + ')', re.IGNORECASE
+        )
+        # Table de dispatch par nom de type Unity (les autres types passent par extract_from_asset)
+        self._object_handlers = {
+            "TextAsset": self.extract_text_asset,
+            "MonoBehaviour": self.extract_monobehaviour_il2cpp,
+            "GameObject": self.extract_gameobject_text,
+            "Transform": self.extract_gameobject_text,
+            "RectTransform": self.extract_gameobject_text,
+        }
         # Détection IL2CPP
         self.is_il2cpp = self._detect_il2cpp()
         if self.is_il2cpp:
@@ -53,8 +208,11 @@ class UnityTextScanner:
 
     def scan_directory(self):
         """Scanne récursivement le dossier du jeu avec focus sur les bundles, ou traite un fichier unique"""
-        unity_extensions = ['.assets', '.bundle', '.resource', '.resS', '.dat']
-        text_extensions = ['.srt', '.json', '.xml', '.txt']
+        self._scan_timestamp = datetime.now().isoformat()
+        # Les fichiers ont pu changer depuis un scan précédent: tout re-décompresser
+        self._decompression_results = {}
+        unity_extensions = UNITY_EXTENSIONS
+        text_extensions = TEXT_EXTENSIONS
         obfuscated_files = []
         
         # Séparer les différents types de fichiers
@@ -66,37 +224,30 @@ class UnityTextScanner:
         if self.game_path.is_file():
             print(f"[INFO] Mode fichier unique: {self.game_path.name}")
             # Traiter un seul fichier
-            file_path = self.game_path
-            if file_path.suffix.lower() == '.bundle':
-                bundle_files.append(file_path)
-            elif any(file_path.suffix.lower() == ext for ext in unity_extensions):
-                unity_files.append(file_path)
-            elif any(file_path.suffix.lower() == ext for ext in text_extensions):
+            candidates = [(str(self.game_path), self.game_path.name)]
+        else:
+            # Mode dossier - scanner récursivement
+            print(f"[INFO] Mode dossier: scan récursif de {self.game_path}")
+            candidates = ((entry.path, entry.name) for entry in iter_files(str(self.game_path)))
+        
+        for path, name in candidates:
+            # Seule l'extension est extraite et mise en minuscules, Path construit seulement si retenu
+            dot = name.rfind('.')
+            if dot < 0:
+                continue
+            ext = name[dot:].lower()
+            if ext == '.bundle':
+                bundle_files.append(Path(path))
+            elif ext in unity_extensions:
+                unity_files.append(Path(path))
+            elif ext in text_extensions:
+                file_path = Path(path)
                 # Vérifier si le fichier texte est obfusqué
                 if XOR_DECODER_AVAILABLE and xor_decoder.is_likely_obfuscated(file_path):
                     obfuscated_files.append(file_path)
                     print(f"[XOR] Fichier potentiellement obfusqué détecté: {file_path.name}")
                 else:
                     text_files.append(file_path)
-        else:
-            # Mode dossier - scanner récursivement
-            print(f"[INFO] Mode dossier: scan récursif de {self.game_path}")
-            for root, dirs, files in os.walk(self.game_path):
-                root_path = Path(root)
-                
-                for file in files:
-                    file_path = root_path / file
-                    if file.lower().endswith('.bundle'):
-                        bundle_files.append(file_path)
-                    elif any(file.lower().endswith(ext) for ext in unity_extensions):
-                        unity_files.append(file_path)
-                    elif any(file.lower().endswith(ext) for ext in text_extensions):
-                        # Vérifier si le fichier texte est obfusqué
-                        if XOR_DECODER_AVAILABLE and xor_decoder.is_likely_obfuscated(file_path):
-                            obfuscated_files.append(file_path)
-                            print(f"[XOR] Fichier potentiellement obfusqué détecté: {file_path.name}")
-                        else:
-                            text_files.append(file_path)
         
         all_files = bundle_files + unity_files + text_files
         total_files = len(all_files)
@@ -124,6 +275,11 @@ class UnityTextScanner:
         # Traiter tous les fichiers en utilisant les listes classées
         files_processed = 0
         
+        if self.max_workers > 1 and total_files > 1:
+            files_processed = self._scan_files_parallel(bundle_files, unity_files, text_files)
+            print(f"[DEBUG] Bilan traitement: {files_processed} fichiers traités ({len(bundle_files)} bundles, {len(unity_files)} Unity, {len(text_files)} textes)")
+            return
+        
         # Traiter les bundles
         for i, file_path in enumerate(bundle_files):
             if self.progress_callback:
@@ -153,64 +309,107 @@ class UnityTextScanner:
         
         print(f"[DEBUG] Bilan traitement: {files_processed} fichiers traités ({len(bundle_files)} bundles, {len(unity_files)} Unity, {len(text_files)} textes)")
 
+    def _scan_files_parallel(self, bundle_files, unity_files, text_files):
+        """Traite chaque fichier dans un processus séparé et concatène les textes trouvés"""
+        jobs = ([('bundle', p) for p in bundle_files] +
+                [('unity', p) for p in unity_files] +
+                [('text', p) for p in text_files])
+        total_files = len(jobs)
+        worker_count = min(self.max_workers, total_files)
+        results = [None] * total_files
+        
+        with ProcessPoolExecutor(max_workers=worker_count) as executor:
+            futures = {
+                executor.submit(
+                    _scan_file_worker,
+                    (str(self.game_path), kind, str(file_path), self._scan_timestamp,
+                     self._decompression_results.get(str(file_path), _NOT_DECOMPRESSED))
+                ): index
+                for index, (kind, file_path) in enumerate(jobs)
+            }
+            
+            for done, future in enumerate(as_completed(futures), 1):
+                index = futures[future]
+                kind, file_path = jobs[index]
+                if self.progress_callback:
+                    self.progress_callback(done / total_files * 100, f"{kind.capitalize()}: {file_path.name}")
+                try:
+                    results[index] = future.result()
+                except Exception as e:
+                    print(f"[ERROR] Échec du processus de scan pour {file_path.name}: {e}")
+        
+        # Concaténation dans l'ordre de découverte, comme en mode séquentiel
+        for texts in results:
+            if texts:
+                self.found_texts.extend(texts)
+        return total_files
+
     def analyze_bundle_structure(self, bundle_files):
         """Analyse en profondeur la structure des bundles"""
         for bundle_path in bundle_files:
             print(f"\n[ANALYSE] {bundle_path.name} ({bundle_path.stat().st_size} bytes)")
             
+            data = None
             try:
-                with open(bundle_path, 'rb') as f:
-                    header = f.read(64)
+                # Un seul chargement du bundle, partagé par toutes les analyses
+                data = self._load_bundle_bytes(bundle_path)
                 
                 # Analyser l'en-tête
-                self.analyze_bundle_header(header, bundle_path.name)
+                self.analyze_bundle_header(data[:64], bundle_path.name)
                 
                 # Essayer différentes méthodes de décompression
-                self.try_decompress_bundle(bundle_path)
+                self.try_decompress_bundle(bundle_path, data)
                 
                 # Recherche de patterns de texte dans le fichier brut
-                self.deep_scan_bundle(bundle_path)
+                self.deep_scan_bundle(bundle_path, data)
                 
             except Exception as e:
                 print(f"    Erreur lors de l'analyse: {e}")
+            finally:
+                if isinstance(data, mmap.mmap):
+                    data.close()
+
+    def _load_bundle_bytes(self, bundle_path):
+        """Lit un bundle en mémoire, ou le projette (mmap) s'il est volumineux"""
+        with open(bundle_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size >= BUNDLE_MMAP_MIN_SIZE:
+                return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            return f.read()
 
     def analyze_bundle_header(self, header, filename):
         """Analyse l'en-tête du bundle pour identifier le format"""
-        print(f"    En-tête (hex): {header[:32].hex()}")
-        print(f"    En-tête (ascii): {self.safe_ascii(header[:32])}")
+        lines = [
+            f"    En-tête (hex): {header[:32].hex()}",
+            f"    En-tête (ascii): {self.safe_ascii(header[:32])}",
+        ]
         
         # Signatures courantes
-        signatures = {
-            b'UnityFS': 'UnityFS Bundle',
-            b'UnityRaw': 'Unity Raw Bundle', 
-            b'UnityWeb': 'Unity Web Bundle',
-            b'\x1f\x8b': 'GZip compressed',
-            b'PK': 'ZIP archive',
-            b'BZ': 'BZip2 compressed',
-            b'\x04\x22\x4d\x18': 'LZ4 compressed',
-            b'\x28\xb5\x2f\xfd': 'Zstandard compressed',
-        }
-        
-        detected = False
-        for sig, desc in signatures.items():
-            if header.startswith(sig):
-                print(f"    Format détecté: {desc}")
-                detected = True
-                break
+        description = next(
+            (desc for sig, desc in self._BUNDLE_SIGNATURES if header.startswith(sig)), None
+        )
         
-        if not detected:
-            print("    Format inconnu - possiblement chiffré ou propriétaire")
+        if description is not None:
+            lines.append(f"    Format détecté: {description}")
+        else:
+            lines.append("    Format inconnu - possiblement chiffré ou propriétaire")
             
-            # Analyser l'entropie pour détecter le chiffrement
+            # L'entropie n'est utile que pour un format non identifié
             entropy = self.calculate_entropy(header)
-            print(f"    Entropie: {entropy:.2f} (>7.5 = probablement chiffré)")
+            lines.append(f"    Entropie: {entropy:.2f} (>7.5 = probablement chiffré)")
+        
+        # Une seule écriture sur la console par en-tête
+        print('\n'.join(lines))
 
     def calculate_entropy(self, data):
         """Calcule l'entropie de Shannon des données"""
         if len(data) == 0:
             return 0
         
-        from collections import Counter
+        if NUMPY_AVAILABLE:
+            counts = np.bincount(np.frombuffer(data, dtype=np.uint8), minlength=256)
+            p = counts[counts > 0] / len(data)
+            return float(-(p * np.log2(p)).sum())
+        
         import math
         
         counter = Counter(data)
@@ -223,22 +422,32 @@ class UnityTextScanner:
 
     def safe_ascii(self, data):
         """Convertit les bytes en ASCII lisible"""
-        return ''.join(chr(b) if 32 <= b <= 126 else '.' for b in data)
+        return bytes(data).translate(self._SAFE_ASCII_TABLE).decode('ascii')
 
-    def try_decompress_bundle(self, bundle_path):
-        """Essaye différentes méthodes de décompression"""
+    def try_decompress_bundle(self, bundle_path, data=None):
+        """Essaye différentes méthodes de décompression (data: contenu déjà chargé du bundle)"""
         print("    Tentatives de décompression:")
         
+        # Un bundle déjà traité (analyse de structure puis mode agressif) n'est pas redécompressé:
+        # ses textes ont déjà été extraits
+        cache_key = str(bundle_path)
+        if cache_key in self._decompression_results:
+            method = self._decompression_results[cache_key]
+            print(f"      ↺ Déjà traité: {method or 'aucune décompression réussie'}")
+            return
+        self._decompression_results[cache_key] = None
+        
         try:
-            with open(bundle_path, 'rb') as f:
-                data = f.read()
+            if data is None:
+                with open(bundle_path, 'rb') as f:
+                    data = f.read()
             
             # Essayer GZip
             try:
-                import gzip
-                decompressed = gzip.decompress(data)
+                decompressed = gzip_backend.decompress(data)
                 print(f"      ✓ GZip: {len(decompressed)} bytes décompressés")
                 self.analyze_decompressed_data(decompressed, bundle_path, "gzip")
+                self._decompression_results[cache_key] = "gzip"
                 return
             except:
                 print("      ✗ GZip failed")
@@ -248,15 +457,17 @@ class UnityTextScanner:
                 decompressed = lz4.frame.decompress(data)
                 print(f"      ✓ LZ4: {len(decompressed)} bytes décompressés")
                 self.analyze_decompressed_data(decompressed, bundle_path, "lz4")
+                self._decompression_results[cache_key] = "lz4"
                 return
             except:
                 print("      ✗ LZ4 failed")
             
             # Essayer zlib
             try:
-                decompressed = zlib.decompress(data)
+                decompressed = zlib_backend.decompress(data)
                 print(f"      ✓ Zlib: {len(decompressed)} bytes décompressés")
                 self.analyze_decompressed_data(decompressed, bundle_path, "zlib")
+                self._decompression_results[cache_key] = "zlib"
                 return
             except:
                 print("      ✗ Zlib failed")
@@ -264,9 +475,10 @@ class UnityTextScanner:
             # Essayer de skipper l'en-tête et décompresser
             for skip in [16, 32, 64, 128, 256]:
                 try:
-                    decompressed = zlib.decompress(data[skip:])
+                    decompressed = zlib_backend.decompress(data[skip:])
                     print(f"      ✓ Zlib (skip {skip}): {len(decompressed)} bytes")
                     self.analyze_decompressed_data(decompressed, bundle_path, f"zlib_skip_{skip}")
+                    self._decompression_results[cache_key] = f"zlib_skip_{skip}"
                     return
                 except:
                     continue
@@ -283,9 +495,10 @@ class UnityTextScanner:
         # Essayer de charger avec UnityPy
         try:
             env = UnityPy.load(data)
-            if len(env.objects) > 0:
-                print(f"      ✓ UnityPy: {len(env.objects)} objets trouvés!")
-                self.process_unity_objects(env.objects, bundle_path, f"decompressed_{method}")
+            objects = env.objects
+            if len(objects) > 0:
+                print(f"      ✓ UnityPy: {len(objects)} objets trouvés!")
+                self.process_unity_objects(objects, bundle_path, f"decompressed_{method}")
                 return
         except:
             pass
@@ -299,38 +512,44 @@ class UnityTextScanner:
             for i, text in enumerate(relevant[:5]):  # Afficher les 5 premières
                 print(f"        - {text[:50]}...")
             
-            # Sauvegarder les textes trouvés
-            for i, text in enumerate(relevant):
-                text_info = {
-                    'id': f"decompressed_{bundle_path.stem}_{method}_{i}",
-                    'source_file': str(bundle_path),
+            # Sauvegarder les textes trouvés (valeurs communes calculées une fois pour le fichier)
+            stem = bundle_path.stem
+            source = str(bundle_path)
+            asset_type = f'Decompressed_{method}'
+            extraction_method = f'decompression_{method}'
+            now_iso = self._scan_timestamp
+            self.found_texts.extend(
+                {
+                    'id': f"decompressed_{stem}_{method}_{i}",
+                    'source_file': source,
                     'asset_name': f"DecompressedString_{i}",
-                    'asset_type': f'Decompressed_{method}',
+                    'asset_type': asset_type,
                     'original_text': text,
                     'translated_text': text,
                     'is_translated': False,
-                    'extraction_date': datetime.now().isoformat(),
-                    'extraction_method': f'decompression_{method}'
+                    'extraction_date': now_iso,
+                    'extraction_method': extraction_method
                 }
-                self.found_texts.append(text_info)
+                for i, text in enumerate(relevant)
+            )
 
-    def deep_scan_bundle(self, bundle_path):
-        """Scan approfondi du bundle pour chercher des patterns de texte"""
+    def deep_scan_bundle(self, bundle_path, data=None):
+        """Scan approfondi du bundle pour chercher des patterns de texte (data: contenu déjà chargé)"""
         print("    Scan approfondi des patterns:")
         
         try:
-            with open(bundle_path, 'rb') as f:
-                data = f.read()
+            if data is None:
+                with open(bundle_path, 'rb') as f:
+                    data = f.read()
             
             # Chercher des patterns spécifiques aux jeux
             patterns_found = []
             
             # Pattern 1: Chaînes Unicode/UTF-16
-            utf16_pattern = rb'(?:\x00[A-Za-z]){4,}'
-            matches = re.findall(utf16_pattern, data)
-            if matches:
-                patterns_found.append(f"UTF-16 patterns: {len(matches)}")
-                for match in matches[:3]:
+            count, samples = self._sample_matches(self._DEEP_UTF16_RE, data)
+            if count:
+                patterns_found.append(f"UTF-16 patterns: {count}")
+                for match in samples:
                     try:
                         decoded = match.decode('utf-16le', errors='ignore').strip('\x00')
                         if len(decoded) > 5:
@@ -339,11 +558,10 @@ class UnityTextScanner:
                         pass
             
             # Pattern 2: JSON-like structures
-            json_pattern = rb'\{"[^"]+"\s*:\s*"[^"]*"\s*[},]'
-            matches = re.findall(json_pattern, data)
-            if matches:
-                patterns_found.append(f"JSON patterns: {len(matches)}")
-                for match in matches[:3]:
+            count, samples = self._sample_matches(self._DEEP_JSON_RE, data)
+            if count:
+                patterns_found.append(f"JSON patterns: {count}")
+                for match in samples:
                     try:
                         decoded = match.decode('utf-8', errors='ignore')
                         print(f"      JSON: {decoded}")
@@ -357,13 +575,9 @@ class UnityTextScanner:
                 for s in length_strings[:3]:
                     print(f"      String: {s[:50]}...")
             
-            # Pattern 4: Dialogue markers
-            dialogue_markers = [
-                rb'dialogue', rb'text', rb'message', rb'subtitle',
-                rb'speaker', rb'voice', rb'conversation'
-            ]
-            
-            for marker in dialogue_markers:
+            # Pattern 4: Dialogue markers (bytes.find par marqueur: recherche accélérée en C,
+            # bien plus rapide qu'une alternation regex évaluée à chaque octet)
+            for marker in self._DIALOGUE_MARKERS:
                 positions = []
                 start = 0
                 while True:
@@ -393,30 +607,57 @@ class UnityTextScanner:
         except Exception as e:
             print(f"      Erreur: {e}")
 
+    def _sample_matches(self, pattern, data, sample_size=3):
+        """
+        Compte les occurrences d'un pattern (plafonné à DEEP_SCAN_MATCH_LIMIT, affiché 'N+')
+        et renvoie les premières, sans matérialiser la liste complète des correspondances
+        """
+        count = 0
+        samples = []
+        for match in pattern.finditer(data):
+            count += 1
+            if len(samples) < sample_size:
+                samples.append(match.group(0))
+            if count >= DEEP_SCAN_MATCH_LIMIT:
+                return f"{count}+", samples
+        return count, samples
+
     def find_length_prefixed_strings(self, data):
         """Trouve les chaînes avec longueur préfixée dans les données"""
         strings = []
+        data_len = len(data)
+        limit = data_len - 8
+        find_candidate = self._LENGTH_PREFIX_CANDIDATE_RE.search
+        # Liaisons locales: évite les recherches d'attributs dans la boucle interne
+        length_formats = self._LENGTH_FORMATS
+        is_game_text = self.is_potential_game_text
+        add_string = strings.append
         i = 0
         
-        while i < len(data) - 8:
+        while i < limit:
+            # Saut direct au prochain offset dont la longueur peut être valide (recherche en C)
+            match = find_candidate(data, i)
+            if match is None or match.start() >= limit:
+                break
+            i = match.start()
             try:
                 # Essayer différents formats de longueur
-                for length_format, size in [('<I', 4), ('<H', 2), ('<Q', 8)]:
-                    if i + size > len(data):
+                for length_struct, size in length_formats:
+                    if i + size > data_len:
                         continue
                         
                     try:
-                        length = struct.unpack(length_format, data[i:i+size])[0]
+                        length = length_struct.unpack_from(data, i)[0]
                         
                         # Vérifier que la longueur est raisonnable
-                        if 5 < length < 500 and i + size + length <= len(data):
+                        if 5 < length < 500 and i + size + length <= data_len:
                             string_data = data[i+size:i+size+length]
                             
                             # Essayer UTF-8
                             try:
                                 decoded = string_data.decode('utf-8', errors='strict')
-                                if self.is_potential_game_text(decoded):
-                                    strings.append(decoded.strip())
+                                if is_game_text(decoded):
+                                    add_string(decoded.strip())
                                     i += size + length
                                     break
                             except:
@@ -426,8 +667,8 @@ class UnityTextScanner:
                             try:
                                 if length % 2 == 0:
                                     decoded = string_data.decode('utf-16le', errors='strict')
-                                    if self.is_potential_game_text(decoded):
-                                        strings.append(decoded.strip())
+                                    if is_game_text(decoded):
+                                        add_string(decoded.strip())
                                         i += size + length
                                         break
                             except:
@@ -439,7 +680,7 @@ class UnityTextScanner:
             except:
                 i += 1
         
-        return list(set(strings))  # Supprimer les doublons
+        return list(dict.fromkeys(strings))  # Supprimer les doublons (ordre de découverte conservé)
 
     def process_bundle_file(self, file_path):
         """Traite spécifiquement un fichier bundle"""
@@ -453,76 +694,93 @@ class UnityTextScanner:
             print(f"[DEBUG] -> Analyse binaire du bundle...")
             self.analyze_binary_file(file_path, aggressive=True)
 
+    def _load_unity_env(self, file_path):
+        """Charge un fichier avec UnityPy et renvoie (env, méthode), env valant None en cas d'échec"""
+        path_str = str(file_path)
+        
+        # Méthode 1: Chargement standard
+        try:
+            return UnityPy.load(path_str), "standard"
+        except (OSError, ImportError, MemoryError):
+            # Fichier illisible ou dépendance manquante: relire les octets échouerait pareil
+            return None, "standard"
+        except Exception:
+            pass
+        
+        # Méthode 2: Chargement en bytes (uniquement après un échec lié au format)
+        try:
+            with open(path_str, 'rb') as f:
+                return UnityPy.load(f.read()), "raw_bytes"
+        except Exception:
+            return None, "standard"
+
     def process_unity_file(self, file_path, is_bundle=False):
         """Traite un fichier Unity avec stratégies IL2CPP"""
         if not is_bundle:
             print(f"[DEBUG] Traitement du fichier Unity : {file_path}")
         
         try:
-            env = None
-            load_method = "standard"
-            
-            # Méthode 1: Chargement standard
-            try:
-                env = UnityPy.load(str(file_path))
-                load_method = "standard"
-            except Exception as e:
-                pass
-            
-            # Méthode 2: Chargement en bytes
-            if env is None:
-                try:
-                    with open(file_path, 'rb') as f:
-                        env = UnityPy.load(f.read())
-                    load_method = "raw_bytes"
-                except Exception as e:
-                    pass
+            env, load_method = self._load_unity_env(file_path)
             
             if env is None:
                 if not is_bundle:
                     print(f"[DEBUG] -> Impossible de charger le fichier")
                 return False
             
+            # env.objects reconstruit la liste à chaque accès: une seule lecture
+            objects = env.objects
+            type_names = None
+            
             if not is_bundle:
-                print(f"[DEBUG] -> Fichier chargé via {load_method}. {len(env.objects)} objets trouvés.")
+                print(f"[DEBUG] -> Fichier chargé via {load_method}. {len(objects)} objets trouvés.")
                 
-                if len(env.objects) > 0:
-                    from collections import Counter
-                    object_types = Counter(obj.type.name for obj in env.objects)
+                if len(objects) > 0:
+                    # Noms de type lus une seule fois, réutilisés par process_unity_objects
+                    type_names = [obj.type.name for obj in objects]
+                    object_types = Counter(type_names)
                     print(f"[DEBUG] -> Types d'objets : {object_types}")
             
-            if len(env.objects) == 0:
+            if len(objects) == 0:
                 return False
             
             # Traiter les objets
-            return self.process_unity_objects(env.objects, file_path, load_method)
+            return self.process_unity_objects(objects, file_path, load_method, type_names)
                 
         except Exception as e:
             if not is_bundle:
                 print(f"[DEBUG] -> Échec du chargement du fichier : {file_path}. Erreur : {e}")
             return False
 
-    def process_unity_objects(self, objects, source_file, load_method):
-        """Traite les objets Unity extraits"""
+    def process_unity_objects(self, objects, source_file, load_method, type_names=None):
+        """Traite les objets Unity extraits (type_names: noms de type déjà lus, dans l'ordre des objets)"""
         extracted_texts = 0
         mono_success = 0
-        mono_total = sum(1 for obj in objects if obj.type.name == "MonoBehaviour")
-        textasset_total = sum(1 for obj in objects if obj.type.name == "TextAsset")
+        mono_total = 0
+        textasset_total = 0
+        
+        # Une seule passe: comptage, filtrage des types sans texte et nom de type mémorisé
+        skipped_types = self._SKIPPED_OBJECT_TYPES
+        if type_names is None:
+            type_names = [obj.type.name for obj in objects]
+        candidates = []
+        for obj, type_name in zip(objects, type_names):
+            if type_name == "MonoBehaviour":
+                mono_total += 1
+            elif type_name == "TextAsset":
+                textasset_total += 1
+            elif type_name in skipped_types:
+                continue
+            candidates.append((obj, type_name))
         
         print(f"[DEBUG] -> Objets trouvés: {textasset_total} TextAssets, {mono_total} MonoBehaviours")
         
-        for obj in objects:
-            if obj.type.name == "TextAsset":
-                if self.extract_text_asset(obj, source_file):
-                    extracted_texts += 1
-            elif obj.type.name == "MonoBehaviour":
-                if self.extract_monobehaviour_il2cpp(obj, source_file):
+        handlers = self._object_handlers
+        default_handler = self.extract_from_asset
+        for obj, type_name in candidates:
+            if handlers.get(type_name, default_handler)(obj, source_file):
+                if type_name == "MonoBehaviour":
                     mono_success += 1
-            elif obj.type.name in ["GameObject", "Transform", "RectTransform"]:
-                if self.extract_gameobject_text(obj, source_file):
-                    extracted_texts += 1
-            else:
-                if self.extract_from_asset(obj, source_file):
+                else:
                     extracted_texts += 1
         
         if mono_total > 0:
@@ -544,17 +802,18 @@ class UnityTextScanner:
         else:
             print(f"[DEBUG] -> Analyse binaire directe de {file_path.name}")
         
+        data = None
         try:
-            with open(file_path, 'rb') as f:
-                data = f.read()
+            # Projeté en mémoire s'il est volumineux: seules les pages parcourues sont chargées
+            data = self._load_bundle_bytes(file_path)
             
-            # Mode agressif: essayer toutes les méthodes
+            # Mode agressif: essayer toutes les méthodes (sur les données déjà lues)
             if aggressive:
                 # Essayer de décompresser d'abord
-                self.try_decompress_bundle(file_path)
+                self.try_decompress_bundle(file_path, data)
                 
                 # Scan approfondi
-                self.deep_scan_bundle(file_path)
+                self.deep_scan_bundle(file_path, data)
             
             # Extraction standard des chaînes
             strings = self.extract_all_strings_from_binary(data)
@@ -563,23 +822,31 @@ class UnityTextScanner:
             if relevant_strings:
                 print(f"[DEBUG] -> {len(relevant_strings)} chaînes potentielles trouvées")
                 
-                for i, text in enumerate(relevant_strings):
-                    text_info = {
-                        'id': f"binary_{file_path.stem}_{i}",
-                        'source_file': str(file_path),
+                stem = file_path.stem
+                source = str(file_path)
+                now_iso = self._scan_timestamp
+                self.found_texts.extend(
+                    {
+                        'id': f"binary_{stem}_{i}",
+                        'source_file': source,
                         'asset_name': f"BinaryString_{i}",
                         'asset_type': 'BinaryExtraction',
                         'original_text': text,
                         'translated_text': text,
                         'is_translated': False,
-                        'extraction_date': datetime.now().isoformat(),
+                        'extraction_date': now_iso,
                         'extraction_method': 'binary_analysis'
                     }
-                    self.found_texts.append(text_info)
-                    if not aggressive:  # Éviter le spam en mode agressif
+                    for i, text in enumerate(relevant_strings)
+                )
+                if not aggressive:  # Éviter le spam en mode agressif
+                    for text in relevant_strings:
                         print(f"    -> Texte binaire: {text[:50]}...")
         except Exception as e:
             print(f"[DEBUG] -> Erreur analyse binaire: {e}")
+        finally:
+            if isinstance(data, mmap.mmap):
+                data.close()
 
     # Garder toutes les autres méthodes existantes...
     def extract_all_strings_from_binary(self, data):
@@ -606,30 +873,26 @@ class UnityTextScanner:
         except Exception as e:
             pass
         
-        # Supprimer les doublons et trier par longueur
-        unique_strings = list(set(strings))
-        return sorted([s for s in unique_strings if len(s) > 3], key=len, reverse=True)
+        # Supprimer les doublons (dict: une passe en C, ordre de découverte conservé) et trier par longueur
+        unique_strings = dict.fromkeys(s for s in strings if len(s) > 3)
+        return sorted(unique_strings, key=len, reverse=True)
 
     def extract_strings_regex(self, data, encoding):
         """Extrait les chaînes avec regex selon l'encodage"""
         strings = []
         try:
             if encoding == 'utf-8':
-                pattern = rb'[\x20-\x7E\xC0-\xFD][\x20-\x7E\x80-\xFD]{3,100}'
-                matches = re.findall(pattern, data)
-                for match in matches:
+                for match in self._UTF8_BYTES_RE.finditer(data):
                     try:
-                        decoded = match.decode('utf-8', errors='ignore').strip()
+                        decoded = match.group(0).decode('utf-8', errors='ignore').strip()
                         if self.is_valid_text_candidate(decoded):
                             strings.append(decoded)
                     except:
                         pass
             elif encoding == 'utf-16le':
-                pattern = rb'(?:\x00[\x20-\x7E]){4,50}'
-                matches = re.findall(pattern, data)
-                for match in matches:
+                for match in self._UTF16_BYTES_RE.finditer(data):
                     try:
-                        decoded = match.decode('utf-16le', errors='ignore').strip()
+                        decoded = match.group(0).decode('utf-16le', errors='ignore').strip()
                         if self.is_valid_text_candidate(decoded):
                             strings.append(decoded)
                     except:
@@ -642,14 +905,12 @@ class UnityTextScanner:
         """Extrait les chaînes depuis les patterns JSON trouvés"""
         strings = []
         try:
-            json_pattern = rb'\{"[^"]+"\s*:\s*"[^"]+"\s*[},]'
-            matches = re.findall(json_pattern, data)
+            matches = self._JSON_BYTES_RE.findall(data)
             
             for match in matches:
                 try:
                     json_str = match.decode('utf-8', errors='ignore')
-                    value_pattern = r':\s*"([^"]+)"'
-                    values = re.findall(value_pattern, json_str)
+                    values = self._JSON_VALUE_RE.findall(json_str)
                     for value in values:
                         if self.is_valid_text_candidate(value):
                             strings.append(value)
@@ -665,27 +926,23 @@ class UnityTextScanner:
         if len(text) < 4:
             return False
         
-        technical_patterns = [
-            r'^[0-9a-fA-F]{8,}$',
-            r'^\d+\.\d+\.\d+',
-            r'^[A-Z_]{6,}$',
-            r'\.dll$|\.exe$|\.so$',
-            r'^m_[A-Z]',
-            r'^UnityEngine\.',
-            r'^System\.',
-            r'^\s*$',
-            r'^[<>/_\-=+*#@$%^&(){}[\]\\|;:,.\d\s]+$',
-            r'^(true|false|null)$',
-        ]
-        
-        for pattern in technical_patterns:
-            if re.match(pattern, text, re.IGNORECASE):
-                return False
+        # Rejets bon marché d'abord (l'ordre compte): la plupart des candidats issus d'un
+        # binaire sont du bruit et ne doivent pas atteindre l'alternation _TECHNICAL_RE
+        if len(set(text)) < 3:  # Remplissage ou octets répétés ("AAAA", "\xff\xff...")
+            return False
         
-        letter_count = sum(1 for c in text if c.isalpha())
+        if text.isascii():
+            # Comptage en C: longueur moins ce qui reste après suppression des lettres
+            encoded = text.encode('ascii')
+            letter_count = len(encoded) - len(encoded.translate(None, self._ASCII_LETTERS))
+        else:
+            letter_count = sum(1 for c in text if c.isalpha())
         if letter_count < len(text) * 0.3:
             return False
         
+        if self._TECHNICAL_RE.match(text):
+            return False
+        
         return True
 
     def is_potential_game_text(self, text):
@@ -697,19 +954,7 @@ class UnityTextScanner:
         if len(text) > 50:
             return True
             
-        # Patterns spécifiques aux jeux (très permissifs)
-        game_patterns = [
-            r'\b(you|your|player|character|game|level|score|points|health|mana|inventory)\b',
-            r'\b(click|press|select|choose|option|menu|settings|save|load)\b',
-            r'\b(dialogue|conversation|speak|talk|say|tell|ask|answer)\b',
-            r'[.!?]\s*$',
-            r'^[A-Z].*[a-z]',
-            r'\b(the|and|for|are|with|this|that|have|from|they|know|want|been|good|much|some|time|very|when|come|here|just|like|long|make|many|over|such|take|than|them|well|were)\b',  # Mots anglais courants
-            r'[a-zA-Z]+\s+[a-zA-Z]+',  # Au moins 2 mots
-            r'[\w\s]{15,}',  # Texte de longueur raisonnable
-        ]
-        
-        return any(re.search(pattern, text, re.IGNORECASE) for pattern in game_patterns) or len(text) > 20
+        return self._GAME_TEXT_RE.search(text) is not None or len(text) > 20
 
     # Méthodes existantes inchangées...
     def extract_monobehaviour_il2cpp(self, obj, source_file):
@@ -761,37 +1006,50 @@ class UnityTextScanner:
         """Extrait les propriétés spécifiques aux jeux IL2CPP"""
         properties = {}
         
-        il2cpp_text_properties = [
-            'm_Text', 'text', 'content', 'value', 'message', 'dialogue',
-            'm_FontData', 'm_Material', 'm_Color', 'm_RaycastTarget',
-            'localizedString', 'localized', 'stringValue', 'textValue',
-            'displayText', 'uiText', 'labelText', 'buttonText',
-            'titleText', 'descriptionText', 'subtitleText'
-        ]
-        
+        # Un seul getattr par propriété (au lieu de hasattr puis getattr)
         found_any = False
-        for prop in il2cpp_text_properties:
-            if hasattr(data, prop):
-                try:
-                    value = getattr(data, prop)
-                    if value is not None:
-                        properties[prop] = value
-                        found_any = True
-                except:
-                    continue
+        for prop in self._IL2CPP_TEXT_PROPERTIES:
+            try:
+                value = getattr(data, prop, MISSING)
+            except Exception:
+                continue
+            if value is not MISSING and value is not None:
+                properties[prop] = value
+                found_any = True
         
         if not found_any:
-            for attr in dir(data):
-                if (not attr.startswith('_') and 
-                    not attr.startswith('read') and 
-                    not callable(getattr(data, attr, None))):
-                    try:
-                        value = getattr(data, attr)
-                        if (value is not None and 
-                            isinstance(value, (str, int, float, bool, list, dict))):
-                            properties[attr] = value
-                    except:
-                        continue
+            # dir() de la classe n'est calculé qu'une fois par type (méthodes exclues)
+            cls = type(data)
+            class_attrs = self._mono_attr_cache.get(cls)
+            if class_attrs is None:
+                class_attrs = tuple(
+                    attr for attr in dir(cls)
+                    if not attr.startswith('_') and not attr.startswith('read')
+                    and not callable(getattr(cls, attr, None))
+                )
+                self._mono_attr_cache[cls] = class_attrs
+            
+            candidates = {}
+            for attr in class_attrs:
+                try:
+                    candidates[attr] = getattr(data, attr)
+                except Exception:
+                    continue
+            
+            # Les champs du TypeTree sont des attributs d'instance, propres à chaque objet:
+            # lus directement dans __dict__, sans passer par le protocole des descripteurs
+            src = getattr(data, '__dict__', None)
+            if isinstance(src, dict):
+                for attr, value in src.items():
+                    if not attr.startswith('_') and not attr.startswith('read') and attr not in class_attrs:
+                        candidates[attr] = value
+            
+            # Ordre alphabétique, comme l'ancien parcours de dir()
+            for attr in sorted(candidates):
+                value = candidates[attr]
+                if (value is not None and 
+                    isinstance(value, (str, int, float, bool, list, dict))):
+                    properties[attr] = value
         
         return properties if properties else None
 
@@ -816,7 +1074,7 @@ class UnityTextScanner:
                 if name_relevant or content_relevant:
                     text_info = {
                         'id': f"{source_file.stem}_{obj.path_id}",
-                        'source_file': str(source_file),
+                        'source_file': sys.intern(str(source_file)),
                         'asset_name': name,
                         'asset_type': 'TextAsset',
                         'content_type': content_type,
@@ -824,7 +1082,7 @@ class UnityTextScanner:
                         'original_text': content,
                         'translated_text': content,
                         'is_translated': False,
-                        'extraction_date': datetime.now().isoformat(),
+                        'extraction_date': self._scan_timestamp,
                         'data_properties': self.get_data_properties(data)
                     }
                     self.found_texts.append(text_info)
@@ -855,14 +1113,14 @@ class UnityTextScanner:
                             
                             text_info = {
                                 'id': f"{source_file.stem}_{obj.path_id}_{attr}",
-                                'source_file': str(source_file),
+                                'source_file': sys.intern(str(source_file)),
                                 'asset_name': f"{name}.{attr}",
-                                'asset_type': f"{obj.type.name}",
+                                'asset_type': obj.type.name,
                                 'path_id': obj.path_id,
                                 'original_text': value,
                                 'translated_text': value,
                                 'is_translated': False,
-                                'extraction_date': datetime.now().isoformat()
+                                'extraction_date': self._scan_timestamp
                             }
                             self.found_texts.append(text_info)
                             print(f"    -> Texte dans {obj.type.name}: {attr}")
@@ -896,14 +1154,14 @@ class UnityTextScanner:
             if text_content and self.is_potential_game_text(text_content):
                 text_info = {
                     'id': f"{source_file.stem}_{obj.path_id}_{obj.type.name}",
-                    'source_file': str(source_file),
+                    'source_file': sys.intern(str(source_file)),
                     'asset_name': name,
                     'asset_type': obj.type.name,
                     'path_id': obj.path_id,
                     'original_text': text_content,
                     'translated_text': text_content,
                     'is_translated': False,
-                    'extraction_date': datetime.now().isoformat()
+                    'extraction_date': self._scan_timestamp
                 }
                 self.found_texts.append(text_info)
                 print(f"  Texte trouvé dans {obj.type.name}: {name}")
@@ -915,46 +1173,65 @@ class UnityTextScanner:
         return False
 
     def search_mono_data(self, data, name, source_file, path_id, path="", depth=0):
-        """Recherche récursive dans les données MonoBehaviour"""
-        if depth > 6:
-            return
-        try:
-            if isinstance(data, dict):
-                for key, value in data.items():
-                    try:
-                        new_path = f"{path}.{key}" if path else key
-                        if isinstance(value, str) and len(value) > 3:
-                            if (self.is_text_relevant(str(key), value) or 
-                                self.is_potential_game_text(value)):
-                                
-                                clean_path = new_path.replace('.', '_').replace('[', '_').replace(']', '_')
-                                text_info = {
-                                    'id': f"{source_file.stem}_{path_id}_{clean_path}",
-                                    'source_file': str(source_file),
-                                    'asset_name': f"{name}.{new_path}",
-                                    'asset_type': 'MonoBehaviour',
-                                    'path_id': path_id,
-                                    'field_path': new_path,
-                                    'original_text': value,
-                                    'translated_text': value,
-                                    'is_translated': False,
-                                    'extraction_date': datetime.now().isoformat()
-                                }
-                                self.found_texts.append(text_info)
-                                print(f"    -> Champ texte: {new_path}")
-                        if isinstance(value, (dict, list)) and depth < 4:
-                            self.search_mono_data(value, name, source_file, path_id, new_path, depth + 1)
-                    except:
-                        continue
-            elif isinstance(data, list) and depth < 4:
-                for i, item in enumerate(data[:100]):
-                    try:
-                        if isinstance(item, (dict, str)):
-                            self.search_mono_data(item, name, source_file, path_id, f"{path}[{i}]", depth + 1)
-                    except:
-                        continue
-        except:
-            pass
+        """Recherche dans les données MonoBehaviour (pile explicite, même ordre qu'un parcours récursif)"""
+        now_iso = self._scan_timestamp
+        source_stem = source_file.stem
+        # Chaînes partagées par tous les enregistrements du fichier / d'un même script
+        source_str = sys.intern(str(source_file))
+        intern = sys.intern
+        # Méthodes liées une fois pour toute la boucle
+        append = self.found_texts.append
+        is_relevant = self.is_text_relevant
+        is_game_text = self.is_potential_game_text
+        # Entrées: (noeud, chemin, profondeur, clé). Une chaîne sur la pile est toujours un champ de dict.
+        stack = [(data, path, depth, None)]
+        while stack:
+            node, node_path, node_depth, key = stack.pop()
+            
+            if isinstance(node, str):
+                try:
+                    if is_relevant(str(key), node) or is_game_text(node):
+                        clean_path = node_path.translate(self._PATH_ID_TABLE)
+                        text_info = {
+                            'id': f"{source_stem}_{path_id}_{clean_path}",
+                            'source_file': source_str,
+                            'asset_name': f"{name}.{node_path}",
+                            'asset_type': 'MonoBehaviour',
+                            'path_id': path_id,
+                            'field_path': intern(node_path),
+                            'original_text': node,
+                            'translated_text': node,
+                            'is_translated': False,
+                            'extraction_date': now_iso
+                        }
+                        append(text_info)
+                        print(f"    -> Champ texte: {node_path}")
+                except Exception:
+                    pass
+                continue
+            
+            if node_depth > 6:
+                continue
+            
+            children = []
+            if isinstance(node, dict):
+                can_descend = node_depth < 4
+                for child_key, value in node.items():
+                    new_path = f"{node_path}.{child_key}" if node_path else child_key
+                    if isinstance(value, str):
+                        # Les chaînes courtes ne sont jamais retenues: inutile de les empiler
+                        if len(value) > 3:
+                            children.append((value, new_path, node_depth + 1, child_key))
+                    elif can_descend and isinstance(value, (dict, list)):
+                        children.append((value, new_path, node_depth + 1, None))
+            elif isinstance(node, list) and node_depth < 4:
+                # Seuls les dicts d'une liste peuvent contenir des champs retenus
+                for i, item in enumerate(islice(node, MONO_LIST_LIMIT)):
+                    if isinstance(item, dict):
+                        children.append((item, f"{node_path}[{i}]", node_depth + 1, None))
+            
+            # Empilés à l'envers pour être dépilés dans l'ordre d'origine
+            stack.extend(reversed(children))
 
     def process_obfuscated_file(self, file_path):
         """Traite un fichier potentiellement obfusqué par XOR"""
@@ -1009,7 +1286,7 @@ class UnityTextScanner:
     def extract_srt_texts(self, content, source_file, xor_key):
         """Extrait le fichier SRT complet décodé (pas en parties séparées)"""
         # Vérifier que c'est bien un contenu SRT valide
-        if '-->' in content and re.search(r'\d{2}:\d{2}:\d{2}', content):
+        if '-->' in content and self._SRT_TIMESTAMP_RE.search(content):
             # Créer un seul TextAsset avec tout le contenu SRT
             text_info = {
                 'id': f"xor_srt_complete_{source_file.stem}",
@@ -1020,10 +1297,10 @@ class UnityTextScanner:
                 'original_text': content,
                 'translated_text': content,
                 'is_translated': False,
-                'extraction_date': datetime.now().isoformat(),
+                'extraction_date': self._scan_timestamp,
                 'extraction_method': f'xor_decryption_key_{xor_key}',
                 'content_length': len(content),
-                'subtitle_count': len(re.findall(r'\d+\s*\n\d{2}:\d{2}:\d{2}', content))
+                'subtitle_count': len(self._SRT_ENTRY_RE.findall(content))
             }
             self.found_texts.append(text_info)
             
@@ -1048,7 +1325,7 @@ class UnityTextScanner:
                 'original_text': content,
                 'translated_text': content,
                 'is_translated': False,
-                'extraction_date': datetime.now().isoformat(),
+                'extraction_date': self._scan_timestamp,
                 'extraction_method': f'xor_decryption_key_{xor_key}',
                 'content_length': len(content)
             }
@@ -1071,7 +1348,7 @@ class UnityTextScanner:
             'original_text': content,
             'translated_text': content,
             'is_translated': False,
-            'extraction_date': datetime.now().isoformat(),
+            'extraction_date': self._scan_timestamp,
             'extraction_method': f'xor_decryption_key_{xor_key}',
             'content_length': len(content),
             'line_count': len(content.split('\n'))
@@ -1093,7 +1370,7 @@ class UnityTextScanner:
             'original_text': content,
             'translated_text': content,
             'is_translated': False,
-            'extraction_date': datetime.now().isoformat(),
+            'extraction_date': self._scan_timestamp,
             'extraction_method': f'xor_decryption_key_{xor_key}',
             'content_length': len(content),
             'line_count': len(content.split('\n'))
@@ -1118,9 +1395,13 @@ class UnityTextScanner:
                 # DEBUG: Analyser le contenu
                 content_length = len(content)
                 has_dialogue = self.contains_dialogue_pattern(content) if content else False
-                is_game_text = self.is_potential_game_text(content) if content else False
+                # Le test de texte de jeu parcourt tout le contenu: inutile si le dialogue suffit déjà
+                if has_dialogue:
+                    is_game_text = None
+                else:
+                    is_game_text = self.is_potential_game_text(content) if content else False
                 
-                print(f"[DEBUG] -> Longueur: {content_length}, Dialogue: {has_dialogue}, GameText: {is_game_text}")
+                print(f"[DEBUG] -> Longueur: {content_length}, Dialogue: {has_dialogue}, GameText: {'non évalué' if is_game_text is None else is_game_text}")
                 if content_length > 0:
                     preview = content[:200].replace('\n', '\\n').replace('\r', '\\r')
                     print(f"[DEBUG] -> Aperçu: {preview}")
@@ -1134,7 +1415,7 @@ class UnityTextScanner:
                         'original_text': content,
                         'translated_text': content,
                         'is_translated': False,
-                        'extraction_date': datetime.now().isoformat()
+                        'extraction_date': self._scan_timestamp
                     }
                     self.found_texts.append(text_info)
                     print(f"  ✅ Fichier texte trouvé: {file_path.name}")
@@ -1147,14 +1428,12 @@ class UnityTextScanner:
 
     def get_asset_name(self, data, obj):
         """Obtient le nom d'un asset de manière robuste"""
-        if hasattr(data, 'name') and data.name:
-            return data.name
-        elif hasattr(data, 'm_Name') and data.m_Name:
-            return data.m_Name
-        elif hasattr(obj, 'name') and obj.name:
-            return obj.name
-        else:
-            return f"Asset_{obj.path_id}"
+        return (
+            getattr(data, 'name', None)
+            or getattr(data, 'm_Name', None)
+            or getattr(obj, 'name', None)
+            or f"Asset_{obj.path_id}"
+        )
 
     def get_asset_content(self, data):
         """Obtient le contenu d'un asset"""
@@ -1189,33 +1468,64 @@ class UnityTextScanner:
     def get_data_properties(self, data):
         """Récupère les propriétés disponibles d'un objet de données"""
         properties = {}
-        for attr in dir(data):
-            if not attr.startswith('_') and not callable(getattr(data, attr)):
-                try:
-                    value = getattr(data, attr)
-                    if value is not None:
-                        properties[attr] = str(type(value).__name__)
-                except:
-                    continue
+        for attr in self._KNOWN_DATA_ATTRS:
+            value = getattr(data, attr, None)
+            if value is not None and not callable(value):
+                properties[attr] = type(value).__name__
         return properties
 
     def is_text_relevant(self, name, content):
         """Vérifie si un texte semble pertinent"""
-        name_lower = name.lower()
-        name_relevant = any(pattern in name_lower for pattern in self.text_patterns)
-        content_relevant = self.contains_dialogue_pattern(content) if content else False
-        return name_relevant or content_relevant
+        name_relevant = self._name_relevance.get(name)
+        if name_relevant is None:
+            name_relevant = self._name_re.search(name) is not None
+            self._name_relevance[name] = name_relevant
+        if name_relevant:
+            return True
+        return self.contains_dialogue_pattern(content) if content else False
 
     def contains_dialogue_pattern(self, content):
         """Vérifie si le contenu contient des patterns de dialogue"""
-        dialogue_patterns = [
-            r'"text"\s*:\s*"[^"]+"',
-            r'<subtitle[^>]*>.*?</subtitle>',
-            r'\d{2}:\d{2}:\d{2}[,\.]\d{3}',
-            r'Dialogue:',
-            r'\[.*?\].*?:.*',
-            r'".*?"',
-            r'[A-Z][a-z]+\s*:\s*[A-Z]',
-            r'[.!?]\s*',
-        ]
-        return any(re.search(pattern, content, re.IGNORECASE) for pattern in dialogue_patterns)
\ No newline at end of file
+        content = content[:DIALOGUE_SCAN_LIMIT]
+        
+        # Marqueurs littéraux suffisants à eux seuls ('.' satisfait déjà [.!?]\s*)
+        if '.' in content or 'Dialogue:' in content or '"text"' in content:
+            return True
+        
+        # Sans aucun marqueur, aucune alternative ne peut correspondre: rejet sans l'alternation
+        if self._DIALOGUE_MARKERS_RE.search(content) is None:
+            return False
+        
+        return self._dialogue_re.search(content) is not None
+
+
+# Scanner réutilisé par chaque processus du pool (regex et caches construits une seule fois)
+_worker_scanner = None
+# Marqueur: bundle pas encore passé par try_decompress_bundle dans le processus principal
+_NOT_DECOMPRESSED = '__not_decompressed__'
+
+
+def _scan_file_worker(args):
+    """
+    Point d'entrée d'un processus du pool: scanne un seul fichier avec le scanner du
+    processus et renvoie la liste des textes trouvés (des dicts, donc picklables)
+    """
+    global _worker_scanner
+    game_path, kind, file_path, scan_timestamp, decompression_result = args
+    if _worker_scanner is None or str(_worker_scanner.game_path) != str(Path(game_path)):
+        _worker_scanner = UnityTextScanner(game_path)
+    scanner = _worker_scanner
+    scanner.found_texts = []
+    scanner._scan_timestamp = scan_timestamp
+    # Les bundles déjà décompressés par l'analyse de structure ne le sont pas une seconde fois
+    scanner._decompression_results = {}
+    if decompression_result != _NOT_DECOMPRESSED:
+        scanner._decompression_results[file_path] = decompression_result
+    file_path = Path(file_path)
+    if kind == 'bundle':
+        scanner.process_bundle_file(file_path)
+    elif kind == 'unity':
+        scanner.process_unity_file(file_path)
+    else:
+        scanner.process_text_file(file_path)
+    return scanner.found_texts
\ No newline at end of file
@@ -13,6 +13,11 @@ import json
 import math
 
 
+# Octets considérés comme lisibles (ASCII imprimable, avec ou sans tab/LF/CR)
+PRINTABLE_BYTES = bytes(range(32, 127))
+PRINTABLE_BYTES_WS = PRINTABLE_BYTES + b'\t\n\r'
+
+
 class XORDecoder:
     def __init__(self):
         """Initialise le décodeur XOR avec les clés communes"""
@@ -66,6 +71,11 @@ class XORDecoder:
         
         return entropy
     
+    def count_printable(self, data: bytes, include_whitespace: bool = True) -> int:
+        """Compte les octets lisibles en une seule passe C (bytes.translate)"""
+        printable = PRINTABLE_BYTES_WS if include_whitespace else PRINTABLE_BYTES
+        return len(data) - len(data.translate(None, printable))
+    
     def detect_xor_obfuscation(self, file_path: Path) -> Optional[int]:
         """
         Détecte si un fichier est obfusqué par XOR et retourne la clé
@@ -121,7 +131,7 @@ class XORDecoder:
                     pattern_matches += 1
             
             # Vérifier la présence de caractères ASCII lisibles
-            printable_chars = sum(1 for b in decoded if 32 <= b <= 126 or b in [9, 10, 13])
+            printable_chars = self.count_printable(decoded)
             printable_ratio = printable_chars / len(decoded)
             
             # Vérifier spécifiquement les patterns SRT (plus permissif)
@@ -177,7 +187,7 @@ class XORDecoder:
         score = 0
         
         # Score basé sur les caractères ASCII lisibles
-        printable_chars = sum(1 for b in data if 32 <= b <= 126 or b in [9, 10, 13])
+        printable_chars = self.count_printable(data)
         printable_ratio = printable_chars / len(data)
         score += printable_ratio * 10  # Max 10 points
         
@@ -232,7 +242,7 @@ class XORDecoder:
                 
                 if has_clear_srt_patterns:
                     # Vérifier le ratio de caractères lisibles
-                    printable_chars = sum(1 for b in header if 32 <= b <= 126 or b in [9, 10, 13])
+                    printable_chars = self.count_printable(header)
                     printable_ratio = printable_chars / len(header)
                     
                     # Si beaucoup de caractères lisibles, c'est probablement un SRT normal
@@ -240,7 +250,7 @@ class XORDecoder:
                         return False
                 
                 # Critères plus stricts pour considérer un fichier comme obfusqué
-                printable_chars = sum(1 for b in header if 32 <= b <= 126 or b in [9, 10, 13])
+                printable_chars = self.count_printable(header)
                 printable_ratio = printable_chars / len(header)
                 entropy = self.calculate_entropy(header)
                 
@@ -249,7 +259,7 @@ class XORDecoder:
             
             # Pour les autres fichiers, logique conservatrice
             entropy = self.calculate_entropy(header)
-            printable_chars = sum(1 for b in header if 32 <= b <= 126)
+            printable_chars = self.count_printable(header, include_whitespace=False)
             printable_ratio = printable_chars / len(header)
             
             return entropy > 7.0 and printable_ratio < 0.2  # Seuils plus stricts